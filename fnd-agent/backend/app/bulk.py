@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .models import Product, ProductDetail, ProductSpec, UsageCheckResponse, UseCase
+from .use_case_checks import evaluate_all
+
+_PRODUCT_COLUMNS = (
+    "sku",
+    "name",
+    "url",
+    "category_slug",
+    "price_per_sqft",
+    "price_per_box",
+    "size_primary",
+    "color",
+    "finish",
+    "store_id",
+    "last_scraped_at",
+)
+
+
+def evaluate_bulk(
+    conn: sqlite3.Connection,
+) -> Iterator[Tuple[str, Dict[UseCase, UsageCheckResponse]]]:
+    """
+    Offline scoring: yield (sku, {use_case: result}) for every product in the DB.
+
+    Products and specs are read with one ordered query each and merged by SKU,
+    instead of the four per-SKU queries product_loader runs for the API. Only
+    specs are loaded; documents and recommended items don't affect the rules.
+    """
+    product_rows = conn.execute(
+        f"SELECT {', '.join(_PRODUCT_COLUMNS)} FROM products ORDER BY sku"
+    )
+    spec_rows = conn.execute(
+        "SELECT sku, spec_key, spec_value FROM product_specs ORDER BY sku, spec_key"
+    )
+    spec_groups = groupby(spec_rows, key=itemgetter(0))
+    pending = next(spec_groups, None)
+
+    for row in product_rows:
+        sku = row[0]
+        # Skip specs whose SKU has no products row.
+        while pending is not None and pending[0] < sku:
+            pending = next(spec_groups, None)
+
+        specs: List[ProductSpec] = []
+        if pending is not None and pending[0] == sku:
+            specs = [
+                ProductSpec(spec_key=r[1], spec_value=r[2] or "") for r in pending[1]
+            ]
+            pending = next(spec_groups, None)
+
+        detail = ProductDetail(
+            product=Product(**dict(zip(_PRODUCT_COLUMNS, row))),
+            specs=specs,
+            documents=[],
+            recommended_items=[],
+        )
+        yield sku, evaluate_all(detail)
+
+
+def evaluate_catalog(
+    products: Iterable[ProductDetail],
+    workers: Optional[int] = None,
+    chunksize: int = 256,
+) -> Iterator[Dict[UseCase, UsageCheckResponse]]:
+    """
+    evaluate_all over many products in a process pool, yielding results in
+    input order. The checkers are pure-CPU Python, so processes (not threads)
+    are what scale; each worker keeps its own spec-index cache. ``chunksize``
+    batches products per task so pickling overhead stays small next to the
+    checker work.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(evaluate_all, products, chunksize=chunksize)
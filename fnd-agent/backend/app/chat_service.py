@@ -9,7 +9,7 @@ from pydantic import BaseModel, Field
 
 from . import product_loader
 from .embedding_store import get_embedding_index
-from .models import ProductDetail, ProductSpec, UseCase
+from .models import ProductDetail, ProductSpec, UsageCheckResponseOut, UseCase
 from .ollama_client import OllamaClient
 from .rules_engine import build_spec_map
 from .use_case_checks import USE_CASE_CHECKERS
@@ -269,7 +269,7 @@ class ChatService:
             if checker is None:
                 raise HTTPException(status_code=400, detail=f"Use case {use_case_value} not supported.")
             usage_result = checker(detail)
-            return json.dumps(usage_result.model_dump(), ensure_ascii=False), [detail]
+            return json.dumps(UsageCheckResponseOut.from_internal(usage_result).model_dump(), ensure_ascii=False), [detail]
 
         raise HTTPException(status_code=400, detail=f"Tool {tool_name} is not supported.")
 
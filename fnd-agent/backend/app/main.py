@@ -6,7 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from . import product_loader
 from .api_products import router as products_router
 from .chat_service import ChatRequest, ChatResponse, ChatService
-from .models import ProductDetail, UsageCheckRequest, UsageCheckResponse
+from .models import ProductDetail, UsageCheckRequest, UsageCheckResponseOut
 from .use_case_checks import USE_CASE_CHECKERS
 
 app = FastAPI(title="FND Agent API", version="0.1.0")
@@ -58,7 +58,7 @@ def get_db():
         conn.close()
 
 
-@app.post("/products/{sku}/usage", response_model=UsageCheckResponse)
+@app.post("/products/{sku}/usage", response_model=UsageCheckResponseOut)
 def check_product_usage(
     sku: str,
     payload: UsageCheckRequest,
@@ -80,7 +80,7 @@ def check_product_usage(
     if checker is None:
         raise HTTPException(status_code=400, detail="Unsupported use case")
 
-    return checker(detail)
+    return UsageCheckResponseOut.from_internal(checker(detail))
 
 
 @app.post("/chat", response_model=ChatResponse)
@@ -1,5 +1,6 @@
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
 
@@ -67,10 +68,41 @@ class UsageCheckRequest(BaseModel):
     use_case: UseCase
 
 
-class UsageCheckResponse(BaseModel):
+# (spec key, value) pairs in the order a checker consulted them.
+SupportingSpecs = Tuple[Tuple[str, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class UsageCheckResponse:
+    """
+    Result of one rules_engine check. A plain slotted dataclass, since the
+    checkers build one per use case per product and their inputs need no
+    validation; API responses go through UsageCheckResponseOut.
+    """
+
+    sku: str
+    use_case: UseCase
+    ok: Optional[bool]
+    confidence: float
+    reason: str
+    supporting_specs: SupportingSpecs
+
+
+class UsageCheckResponseOut(BaseModel):
     sku: str
     use_case: UseCase
     ok: Optional[bool]
     confidence: float
     reason: str
     supporting_specs: Dict[str, str]
+
+    @classmethod
+    def from_internal(cls, result: UsageCheckResponse) -> "UsageCheckResponseOut":
+        return cls(
+            sku=result.sku,
+            use_case=result.use_case,
+            ok=result.ok,
+            confidence=result.confidence,
+            reason=result.reason,
+            supporting_specs=dict(result.supporting_specs),
+        )
@@ -1,9 +1,101 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, Optional
+import sys
+import weakref
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 
-from .models import ProductDetail, UsageCheckResponse, UseCase
+from .models import ProductDetail, SupportingSpecs, UsageCheckResponse, UseCase
+
+# Stand-in for "no supporting specs" on the early no-data returns.
+_EMPTY_SUPPORTING: SupportingSpecs = ()
+
+
+class SpecIndex(Dict[str, Tuple[str, str]]):
+    """
+    Spec key -> (value, lowercased value). Checkers test keywords against the
+    lowercased form and report the original one in supporting_specs.
+
+    ``present`` has the _KEY_BITS bit set for every checker key the product
+    has, so a checker can bail out with a single AND when none of its keys
+    are there. The frost/water flags hold the keyword classification of
+    those two specs, which most outdoor and wet-area checkers test.
+    """
+
+    __slots__ = (
+        "present",
+        "frost_negative",
+        "frost_positive",
+        "water_negative",
+        "water_not_resistant",
+    )
+
+
+_NO_SPEC: Tuple[str, str] = ("", "")
+
+# id(detail) -> spec index, dropped by a weakref finalizer when the detail is
+# collected. Pydantic models are unhashable, so they can't key a
+# WeakKeyDictionary, and private-attribute access on them costs about as
+# much as rebuilding the index.
+_SPEC_INDEX_CACHE: Dict[int, SpecIndex] = {}
+
+
+# Spec keys the checkers look up. build_spec_map interns the keys it emits,
+# so lookups with these constants hit the identity fast path of dict lookup.
+_K_PLACEMENT = sys.intern("placement location")
+_K_INSTALL = sys.intern("installation options")
+_K_WATER_RES = sys.intern("water resistance")
+_K_PEI = sys.intern("pei rating")
+_K_FLOOR = sys.intern("floor suitability rating")
+_K_DCOF_V = sys.intern("dcof value")
+_K_DCOF = sys.intern("dcof")
+_K_THICK = sys.intern("product thickness")
+_K_FROST = sys.intern("frost resistance")
+_K_ABSORB = sys.intern("water absorption")
+_K_MAT = sys.intern("material")
+_K_BATHROOM = sys.intern("bathroom floor use")
+_K_SHOWER = sys.intern("shower surface")
+_K_FIREPLACE = sys.intern("fireplace surround use")
+_K_RADIANT = sys.intern("radiant heat compatible")
+_K_RADIANT_ALT = sys.intern("radiant heat compatibility")
+
+# Alternate spec names -> the key the checkers read. The spec index fills the
+# canonical key from its alias when only the alias is present, so each
+# concept is a single lookup.
+_SPEC_ALIASES: Tuple[Tuple[str, str], ...] = (
+    (_K_DCOF, _K_DCOF_V),
+    (_K_RADIANT_ALT, _K_RADIANT),
+)
+
+_KEY_BITS: Dict[str, int] = {
+    key: 1 << bit
+    for bit, key in enumerate(
+        (
+            _K_PLACEMENT,
+            _K_INSTALL,
+            _K_WATER_RES,
+            _K_PEI,
+            _K_FLOOR,
+            _K_DCOF_V,
+            _K_THICK,
+            _K_FROST,
+            _K_ABSORB,
+            _K_MAT,
+            _K_BATHROOM,
+            _K_SHOWER,
+            _K_FIREPLACE,
+            _K_RADIANT,
+        )
+    )
+}
+
+
+def _key_bits(*keys: str) -> int:
+    bits = 0
+    for key in keys:
+        bits |= _KEY_BITS[key]
+    return bits
 
 
 def build_spec_map(detail: ProductDetail) -> Dict[str, str]:
@@ -11,7 +103,7 @@ def build_spec_map(detail: ProductDetail) -> Dict[str, str]:
     Turn list of ProductSpec into a dict:
       { 'bathroom floor use': 'Not Suitable for Bathroom Floor', ... }
 
-    - lowercase keys
+    - lowercase, interned keys
     - collapse whitespace
     - if we see the same key multiple times, keep the *shortest* value
       (tends to be the actual spec, not the giant marketing blob).
@@ -19,7 +111,7 @@ def build_spec_map(detail: ProductDetail) -> Dict[str, str]:
     spec_map: Dict[str, str] = {}
 
     for spec in detail.specs:
-        key = spec.spec_key.strip().lower()
+        key = sys.intern(spec.spec_key.strip().lower())
         if not key:
             continue
         val = " ".join(spec.spec_value.split())  # collapse crazy whitespace
@@ -31,11 +123,58 @@ def build_spec_map(detail: ProductDetail) -> Dict[str, str]:
     return spec_map
 
 
+def _cached_spec_index(detail: ProductDetail) -> SpecIndex:
+    """
+    build_spec_map plus a lowercased copy of each value, memoized per detail
+    so evaluating several use cases for the same product only normalizes and
+    lowercases its specs once. Empty values are left out; every checker
+    treats them the same as a missing spec.
+    """
+    key = id(detail)
+    index = _SPEC_INDEX_CACHE.get(key)
+    if index is None:
+        index = SpecIndex(
+            (k, (v, v.lower())) for k, v in build_spec_map(detail).items() if v
+        )
+        for alias, canonical in _SPEC_ALIASES:
+            if alias in index and canonical not in index:
+                index[canonical] = index[alias]
+        present = 0
+        for k in index:
+            present |= _KEY_BITS.get(k, 0)
+        index.present = present
+        frost_low = index.get(_K_FROST, _NO_SPEC)[1]
+        index.frost_negative = _matches(_FROST_NEG, frost_low)
+        index.frost_positive = _matches(_FROST_POS, frost_low)
+        water_low = index.get(_K_WATER_RES, _NO_SPEC)[1]
+        index.water_negative = _matches(_NEG_WATER, water_low)
+        index.water_not_resistant = _matches(_NOT_WATER_RESISTANT, water_low)
+        _SPEC_INDEX_CACHE[key] = index
+        weakref.finalize(detail, _SPEC_INDEX_CACHE.pop, key, None)
+    return index
+
+
+_MIXED_FRACTION_RE = re.compile(r"(-?\d+)\s+(\d+)\s*/\s*(\d+)")
+_FRACTION_RE = re.compile(r"(-?\d+)\s*/\s*(\d+)")
+_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+# Spec values repeat heavily across the catalog ("4", "0.42", "3/8 in."), so
+# parsed results are memoized by raw string.
+@lru_cache(maxsize=4096)
 def _extract_float(raw: str) -> Optional[float]:
     if not raw:
         return None
+    # Most PEI / absorption / DCOF values are bare numbers ("4", "0.5");
+    # parse those directly before falling back to the regex scans.
+    stripped = raw.strip()
+    if stripped[:1].isdigit() and stripped.replace(".", "", 1).isdigit():
+        try:
+            return float(stripped)
+        except ValueError:
+            pass
     normalized = raw.replace(",", " ")
-    mixed = re.search(r"(-?\d+)\s+(\d+)\s*/\s*(\d+)", normalized)
+    mixed = _MIXED_FRACTION_RE.search(normalized)
     if mixed:
         try:
             whole = float(mixed.group(1))
@@ -45,7 +184,7 @@ def _extract_float(raw: str) -> Optional[float]:
                 return whole + (numerator / denominator if whole >= 0 else -numerator / denominator)
         except ValueError:
             pass
-    frac = re.search(r"(-?\d+)\s*/\s*(\d+)", normalized)
+    frac = _FRACTION_RE.search(normalized)
     if frac:
         try:
             numerator = float(frac.group(1))
@@ -54,7 +193,7 @@ def _extract_float(raw: str) -> Optional[float]:
                 return numerator / denominator
         except ValueError:
             pass
-    match = re.search(r"-?\d+(?:\.\d+)?", normalized)
+    match = _NUMBER_RE.search(normalized)
     if match:
         try:
             return float(match.group())
@@ -63,279 +202,385 @@ def _extract_float(raw: str) -> Optional[float]:
     return None
 
 
-def _contains_any(raw: str, *keywords: str) -> bool:
-    if not raw:
-        return False
-    low = raw.lower()
-    return any(keyword in low for keyword in keywords)
+def _keywords(*keywords: str) -> re.Pattern[str]:
+    """Compile keywords into one alternation; a search hits if any keyword is a substring."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+def _matches(pattern: re.Pattern[str], low: str) -> bool:
+    return pattern.search(low) is not None
+
+
+# Keyword sets shared by the checkers, compiled once at import. Keywords are
+# matched against the lowercased spec value from the spec index.
+_FROST_NEG = _keywords("no", "not resistant")
+_FROST_POS = _keywords("yes", "resistant", "rated")
+_NOT_WATER_RESISTANT = _keywords("not water", "not resistant")
+_NEG_WATER = _keywords("not water", "not resistant", "not recommended")
+_NEG_WATER_PATIO = _keywords("not water", "not resistant", "not recommended", "no ")
+_WATERPROOF = _keywords("waterproof", "water resistant", "water-resistent")
+_BATHROOM_NEG = _keywords("not suitable")
+_BATHROOM_POS = _keywords("suitable", "yes")
+_COMMERCIAL_FLOOR = _keywords("heavy commercial", "commercial")
+_LIGHT_FLOOR = _keywords("residential only", "light", "wall only")
+_HEAVY_FLOOR = _keywords("heavy", "commercial", "garage")
+_WALL_ONLY_FLOOR = _keywords("wall only", "light wall")
+_RESTAURANT_FLOOR = _keywords("commercial", "heavy", "restaurant")
+_RESIDENTIAL_OR_WALL_FLOOR = _keywords("residential only", "wall")
+_WOOD_MATERIAL = _keywords("wood", "bamboo", "cork")
+
 
+class _Verdict(NamedTuple):
+    """The fixed part of a checker's answer; only sku and supporting specs vary."""
 
-def _mk_response(
+    use_case: UseCase
+    ok: Optional[bool]
+    confidence: float
+    reason: str
+
+
+def _apply(
+    verdict: _Verdict,
     detail: ProductDetail,
-    use_case: UseCase,
-    ok,
-    confidence: float,
-    reason: str,
-    supporting_specs: Dict[str, str],
+    supporting_specs: Sequence[Tuple[str, str]],
 ) -> UsageCheckResponse:
     return UsageCheckResponse(
         sku=detail.product.sku,
-        use_case=use_case,
-        ok=ok,
-        confidence=confidence,
-        reason=reason,
-        supporting_specs=supporting_specs,
+        use_case=verdict.use_case,
+        ok=verdict.ok,
+        confidence=verdict.confidence,
+        reason=verdict.reason,
+        supporting_specs=tuple(supporting_specs),
     )
 
 
+class _KeywordRule(NamedTuple):
+    """Verdict to return when a spec value contains any of the rule's keywords."""
+
+    pattern: re.Pattern[str]
+    verdict: _Verdict
+
+
+class _SingleSpecCheck(NamedTuple):
+    """
+    A use case decided by one explicit spec: its value is tested against
+    ``rules`` in order, and the first hit wins. Without a hit the check
+    returns ``fallback``.
+    """
+
+    key: str
+    rules: Tuple[_KeywordRule, ...]
+    fallback: _Verdict
+
+
+def _first_rule(rules: Tuple[_KeywordRule, ...], low: str) -> Optional[_Verdict]:
+    for rule in rules:
+        if rule.pattern.search(low) is not None:
+            return rule.verdict
+    return None
+
+
+def _evaluate_single_spec(detail: ProductDetail, check: _SingleSpecCheck) -> UsageCheckResponse:
+    specs = _cached_spec_index(detail)
+
+    value, low = specs.get(check.key, _NO_SPEC)
+    if not value:
+        return _apply(check.fallback, detail, _EMPTY_SUPPORTING)
+
+    supporting = ((check.key, value),)
+    verdict = _first_rule(check.rules, low)
+    return _apply(verdict or check.fallback, detail, supporting)
+
+
+_BATHROOM_FLOOR_RULES = (
+    _KeywordRule(
+        _BATHROOM_NEG,
+        _Verdict(
+            UseCase.bathroom_floor,
+            ok=False,
+            confidence=0.95,
+            reason="Spec 'Bathroom Floor Use' says 'Not Suitable for Bathroom Floor'.",
+        ),
+    ),
+    _KeywordRule(
+        _BATHROOM_POS,
+        _Verdict(
+            UseCase.bathroom_floor,
+            ok=True,
+            confidence=0.9,
+            reason="Spec 'Bathroom Floor Use' indicates bathroom floor use is allowed.",
+        ),
+    ),
+)
+
+_BATHROOM_FLOOR_WET_AREA_HINT = _Verdict(
+    UseCase.bathroom_floor,
+    ok=None,
+    confidence=0.6,
+    reason="No explicit 'Bathroom Floor Use' spec. Product is water-resistant / has placement info, but bathroom floor suitability isn’t guaranteed.",
+)
+
+_BATHROOM_FLOOR_UNKNOWN = _Verdict(
+    UseCase.bathroom_floor,
+    ok=None,
+    confidence=0.0,
+    reason="No relevant specs found for bathroom floor usage.",
+)
+
+_BATHROOM_FLOOR_KEYS = _key_bits(_K_BATHROOM, _K_PLACEMENT, _K_WATER_RES)
+
+
 def check_bathroom_floor(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _BATHROOM_FLOOR_KEYS:
+        return _apply(_BATHROOM_FLOOR_UNKNOWN, detail, _EMPTY_SUPPORTING)
 
-    bf = spec_map.get("bathroom floor use", "")
+    supporting: List[Tuple[str, str]] = []
+
+    bf, bf_low = specs.get(_K_BATHROOM, _NO_SPEC)
     if bf:
-        supporting["bathroom floor use"] = bf
-        low = bf.lower()
-        if "not suitable" in low:
-            return _mk_response(
-                detail,
-                UseCase.bathroom_floor,
-                ok=False,
-                confidence=0.95,
-                reason="Spec 'Bathroom Floor Use' says 'Not Suitable for Bathroom Floor'.",
-                supporting_specs=supporting,
-            )
-        if "suitable" in low or "yes" in low:
-            return _mk_response(
-                detail,
-                UseCase.bathroom_floor,
-                ok=True,
-                confidence=0.9,
-                reason="Spec 'Bathroom Floor Use' indicates bathroom floor use is allowed.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_BATHROOM, bf))
+        verdict = _first_rule(_BATHROOM_FLOOR_RULES, bf_low)
+        if verdict is not None:
+            return _apply(verdict, detail, supporting)
 
-    water = spec_map.get("water resistance", "")
-    placement = spec_map.get("placement location", "")
+    water = specs.get(_K_WATER_RES, _NO_SPEC)[0]
+    placement = specs.get(_K_PLACEMENT, _NO_SPEC)[0]
     if water:
-        supporting["water resistance"] = water
+        supporting.append((_K_WATER_RES, water))
     if placement:
-        supporting["placement location"] = placement
+        supporting.append((_K_PLACEMENT, placement))
 
     if water or placement:
-        return _mk_response(
-            detail,
-            UseCase.bathroom_floor,
-            ok=None,
-            confidence=0.6,
-            reason="No explicit 'Bathroom Floor Use' spec. Product is water-resistant / has placement info, but bathroom floor suitability isn’t guaranteed.",
-            supporting_specs=supporting,
-        )
+        return _apply(_BATHROOM_FLOOR_WET_AREA_HINT, detail, supporting)
+
+    return _apply(_BATHROOM_FLOOR_UNKNOWN, detail, supporting)
+
+
+_SHOWER_FLOOR_RULES = (
+    _KeywordRule(
+        _keywords("not suitable for shower floors", "not suitable for shower floor"),
+        _Verdict(
+            UseCase.shower_floor,
+            ok=False,
+            confidence=0.95,
+            reason="Spec 'Shower Surface' explicitly says it is not suitable for shower floors.",
+        ),
+    ),
+    _KeywordRule(
+        _keywords("suitable for shower floors", "suitable for shower floor"),
+        _Verdict(
+            UseCase.shower_floor,
+            ok=True,
+            confidence=0.9,
+            reason="Spec 'Shower Surface' indicates it is suitable for shower floors.",
+        ),
+    ),
+)
 
-    return _mk_response(
-        detail,
-        UseCase.bathroom_floor,
-        ok=None,
-        confidence=0.0,
-        reason="No relevant specs found for bathroom floor usage.",
-        supporting_specs=supporting,
-    )
+_SHOWER_FLOOR_UNKNOWN = _Verdict(
+    UseCase.shower_floor,
+    ok=None,
+    confidence=0.4,
+    reason="No explicit shower floor spec. Check DCOF and manufacturer guidelines before using on a shower floor.",
+)
+
+_SHOWER_FLOOR_KEYS = _key_bits(_K_DCOF_V, _K_SHOWER)
 
 
 def check_shower_floor(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _SHOWER_FLOOR_KEYS:
+        return _apply(_SHOWER_FLOOR_UNKNOWN, detail, _EMPTY_SUPPORTING)
 
-    shower_surface = spec_map.get("shower surface", "")
+    supporting: List[Tuple[str, str]] = []
+
+    shower_surface, shower_surface_low = specs.get(_K_SHOWER, _NO_SPEC)
     if shower_surface:
-        supporting["shower surface"] = shower_surface
-        low = shower_surface.lower()
-        if "not suitable for shower floors" in low or "not suitable for shower floor" in low:
-            return _mk_response(
-                detail,
-                UseCase.shower_floor,
-                ok=False,
-                confidence=0.95,
-                reason="Spec 'Shower Surface' explicitly says it is not suitable for shower floors.",
-                supporting_specs=supporting,
-            )
-        if "suitable for shower floors" in low or "suitable for shower floor" in low:
-            return _mk_response(
-                detail,
-                UseCase.shower_floor,
-                ok=True,
-                confidence=0.9,
-                reason="Spec 'Shower Surface' indicates it is suitable for shower floors.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_SHOWER, shower_surface))
+        verdict = _first_rule(_SHOWER_FLOOR_RULES, shower_surface_low)
+        if verdict is not None:
+            return _apply(verdict, detail, supporting)
 
-    dcof = spec_map.get("dcof value", "") or spec_map.get("dcof", "")
+    dcof = specs.get(_K_DCOF_V, _NO_SPEC)[0]
     if dcof:
-        supporting["dcof"] = dcof
-
-    return _mk_response(
-        detail,
-        UseCase.shower_floor,
-        ok=None,
-        confidence=0.4,
-        reason="No explicit shower floor spec. Check DCOF and manufacturer guidelines before using on a shower floor.",
-        supporting_specs=supporting,
-    )
+        supporting.append((_K_DCOF, dcof))
 
+    return _apply(_SHOWER_FLOOR_UNKNOWN, detail, supporting)
 
-def check_shower_wall(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
 
-    shower_surface = spec_map.get("shower surface", "")
-    if shower_surface:
-        supporting["shower surface"] = shower_surface
-        low = shower_surface.lower()
-        if "suitable for shower walls" in low:
-            return _mk_response(
-                detail,
+_SHOWER_WALL = _SingleSpecCheck(
+    key=_K_SHOWER,
+    rules=(
+        _KeywordRule(
+            _keywords("suitable for shower walls"),
+            _Verdict(
                 UseCase.shower_wall,
                 ok=True,
                 confidence=0.9,
                 reason="Spec 'Shower Surface' indicates it is suitable for shower walls.",
-                supporting_specs=supporting,
-            )
-        if "not suitable for shower walls" in low:
-            return _mk_response(
-                detail,
+            ),
+        ),
+        _KeywordRule(
+            _keywords("not suitable for shower walls"),
+            _Verdict(
                 UseCase.shower_wall,
                 ok=False,
                 confidence=0.95,
                 reason="Spec 'Shower Surface' explicitly says it is not suitable for shower walls.",
-                supporting_specs=supporting,
-            )
-
-    return _mk_response(
-        detail,
+            ),
+        ),
+    ),
+    fallback=_Verdict(
         UseCase.shower_wall,
         ok=None,
         confidence=0.4,
         reason="No explicit shower wall spec found. Likely okay for many tiles rated for wet walls, but verify with full specs.",
-        supporting_specs=supporting,
-    )
+    ),
+)
 
 
-def check_fireplace_surround(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
-
-    fp = spec_map.get("fireplace surround use", "")
-    if fp:
-        supporting["fireplace surround use"] = fp
-        low = fp.lower()
-        if "yes" in low or "suitable" in low:
-            return _mk_response(
-                detail,
+def check_shower_wall(detail: ProductDetail) -> UsageCheckResponse:
+    return _evaluate_single_spec(detail, _SHOWER_WALL)
+
+
+_FIREPLACE_SURROUND = _SingleSpecCheck(
+    key=_K_FIREPLACE,
+    rules=(
+        _KeywordRule(
+            _keywords("yes", "suitable"),
+            _Verdict(
                 UseCase.fireplace_surround,
                 ok=True,
                 confidence=0.9,
                 reason="Spec 'Fireplace Surround Use' indicates it is suitable around fireplaces.",
-                supporting_specs=supporting,
-            )
-        if "no" in low or "not suitable" in low:
-            return _mk_response(
-                detail,
+            ),
+        ),
+        _KeywordRule(
+            _keywords("no", "not suitable"),
+            _Verdict(
                 UseCase.fireplace_surround,
                 ok=False,
                 confidence=0.95,
                 reason="Spec 'Fireplace Surround Use' indicates it is not suitable around fireplaces.",
-                supporting_specs=supporting,
-            )
-
-    return _mk_response(
-        detail,
+            ),
+        ),
+    ),
+    fallback=_Verdict(
         UseCase.fireplace_surround,
         ok=None,
         confidence=0.3,
         reason="No explicit fireplace surround spec found. Check heat tolerance and manufacturer documentation.",
-        supporting_specs=supporting,
-    )
+    ),
+)
 
 
-def check_radiant_heat(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+def check_fireplace_surround(detail: ProductDetail) -> UsageCheckResponse:
+    return _evaluate_single_spec(detail, _FIREPLACE_SURROUND)
 
-    rh = spec_map.get("radiant heat compatible", "") or spec_map.get(
-        "radiant heat compatibility", ""
-    )
-    if rh:
-        supporting["radiant heat compatible"] = rh
-        low = rh.lower()
-        if "yes" in low or "compatible" in low:
-            return _mk_response(
-                detail,
+
+_RADIANT_HEAT = _SingleSpecCheck(
+    key=_K_RADIANT,
+    rules=(
+        _KeywordRule(
+            _keywords("yes", "compatible"),
+            _Verdict(
                 UseCase.radiant_heat,
                 ok=True,
                 confidence=0.9,
                 reason="Spec indicates compatibility with radiant heat.",
-                supporting_specs=supporting,
-            )
-        if "no" in low or "not compatible" in low:
-            return _mk_response(
-                detail,
+            ),
+        ),
+        _KeywordRule(
+            _keywords("no", "not compatible"),
+            _Verdict(
                 UseCase.radiant_heat,
                 ok=False,
                 confidence=0.95,
                 reason="Spec indicates this product is not compatible with radiant heat.",
-                supporting_specs=supporting,
-            )
-
-    return _mk_response(
-        detail,
+            ),
+        ),
+    ),
+    fallback=_Verdict(
         UseCase.radiant_heat,
         ok=None,
         confidence=0.3,
         reason="No explicit radiant heat spec found. Check system and manufacturer guidelines.",
-        supporting_specs=supporting,
-    )
+    ),
+)
+
+
+def check_radiant_heat(detail: ProductDetail) -> UsageCheckResponse:
+    return _evaluate_single_spec(detail, _RADIANT_HEAT)
+
+
+_PATIO_INDOOR_ONLY = _Verdict(
+    UseCase.outdoor_patio,
+    ok=False,
+    confidence=0.9,
+    reason="Placement spec restricts this product to indoor installations.",
+)
+
+_PATIO_NOT_FROST_RESISTANT = _Verdict(
+    UseCase.outdoor_patio,
+    ok=False,
+    confidence=0.9,
+    reason="Spec 'Frost Resistance' indicates the material is not frost resistant.",
+)
+
+_PATIO_OK = _Verdict(
+    UseCase.outdoor_patio,
+    ok=True,
+    confidence=0.85,
+    reason="Specs indicate outdoor placement and freeze-thaw readiness, suitable for patios.",
+)
+
+_PATIO_NOT_WATER_RESISTANT = _Verdict(
+    UseCase.outdoor_patio,
+    ok=False,
+    confidence=0.8,
+    reason="Water-resistance spec warns against exposure, so an uncovered patio is risky.",
+)
+
+_PATIO_UNKNOWN = _Verdict(
+    UseCase.outdoor_patio,
+    ok=None,
+    confidence=0.4,
+    reason="Outdoor placement or freeze-thaw data not found. Verify frost resistance before patio use.",
+)
+
+_PATIO_KEYS = _key_bits(_K_ABSORB, _K_FROST, _K_PLACEMENT, _K_WATER_RES)
 
 
 def check_outdoor_patio(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _PATIO_KEYS:
+        return _apply(_PATIO_UNKNOWN, detail, _EMPTY_SUPPORTING)
 
-    placement = spec_map.get("placement location", "")
-    frost = spec_map.get("frost resistance", "")
-    water_absorption = spec_map.get("water absorption", "")
-    water_resistance = spec_map.get("water resistance", "")
+    supporting: List[Tuple[str, str]] = []
+
+    placement, placement_low = specs.get(_K_PLACEMENT, _NO_SPEC)
+    frost = specs.get(_K_FROST, _NO_SPEC)[0]
+    water_absorption = specs.get(_K_ABSORB, _NO_SPEC)[0]
+    water_resistance, water_resistance_low = specs.get(_K_WATER_RES, _NO_SPEC)
 
     if placement:
-        supporting["placement location"] = placement
-        if "indoor only" in placement.lower():
-            return _mk_response(
-                detail,
-                UseCase.outdoor_patio,
-                ok=False,
-                confidence=0.9,
-                reason="Placement spec restricts this product to indoor installations.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_PLACEMENT, placement))
+        if "indoor only" in placement_low:
+            return _apply(_PATIO_INDOOR_ONLY, detail, supporting)
 
     if frost:
-        supporting["frost resistance"] = frost
-        if _contains_any(frost, "no", "not resistant"):
-            return _mk_response(
-                detail,
-                UseCase.outdoor_patio,
-                ok=False,
-                confidence=0.9,
-                reason="Spec 'Frost Resistance' indicates the material is not frost resistant.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_FROST, frost))
+        if specs.frost_negative:
+            return _apply(_PATIO_NOT_FROST_RESISTANT, detail, supporting)
 
     if water_absorption:
-        supporting["water absorption"] = water_absorption
+        supporting.append((_K_ABSORB, water_absorption))
 
     freeze_ready = False
-    if placement and "outdoor" in placement.lower():
+    if "outdoor" in placement_low:
         freeze_ready = True
-    if frost and _contains_any(frost, "yes", "resistant", "rated"):
+    if specs.frost_positive:
         freeze_ready = True
 
     water_abs_val = _extract_float(water_absorption)
@@ -343,908 +588,989 @@ def check_outdoor_patio(detail: ProductDetail) -> UsageCheckResponse:
         freeze_ready = True
 
     if freeze_ready:
-        return _mk_response(
-            detail,
-            UseCase.outdoor_patio,
-            ok=True,
-            confidence=0.85,
-            reason="Specs indicate outdoor placement and freeze-thaw readiness, suitable for patios.",
-            supporting_specs=supporting,
-        )
+        return _apply(_PATIO_OK, detail, supporting)
 
     if water_resistance:
-        supporting["water resistance"] = water_resistance
-        if _contains_any(
-            water_resistance,
-            "not water",
-            "not resistant",
-            "not recommended",
-            "no ",
-        ):
-            return _mk_response(
-                detail,
-                UseCase.outdoor_patio,
-                ok=False,
-                confidence=0.8,
-                reason="Water-resistance spec warns against exposure, so an uncovered patio is risky.",
-                supporting_specs=supporting,
-            )
-
-    return _mk_response(
-        detail,
-        UseCase.outdoor_patio,
-        ok=None,
-        confidence=0.4,
-        reason="Outdoor placement or freeze-thaw data not found. Verify frost resistance before patio use.",
-        supporting_specs=supporting,
-    )
+        supporting.append((_K_WATER_RES, water_resistance))
+        if _matches(_NEG_WATER_PATIO, water_resistance_low):
+            return _apply(_PATIO_NOT_WATER_RESISTANT, detail, supporting)
+
+    return _apply(_PATIO_UNKNOWN, detail, supporting)
+
+
+_POOL_DECK_NOT_OUTDOOR = _Verdict(
+    UseCase.pool_deck,
+    ok=False,
+    confidence=0.85,
+    reason="Spec does not list outdoor placement, so a pool deck installation is not recommended.",
+)
+
+_POOL_DECK_NOT_WATER_RESISTANT = _Verdict(
+    UseCase.pool_deck,
+    ok=False,
+    confidence=0.95,
+    reason="Spec indicates the product is not water resistant; standing water from a pool deck would damage it.",
+)
+
+_POOL_DECK_OK = _Verdict(
+    UseCase.pool_deck,
+    ok=True,
+    confidence=0.9,
+    reason="DCOF rating meets wet-area slip guidance (>= 0.42) and product is rated for outdoor use.",
+)
+
+_POOL_DECK_SLIPPERY = _Verdict(
+    UseCase.pool_deck,
+    ok=False,
+    confidence=0.85,
+    reason="DCOF rating below 0.42 indicates the surface may be too slippery for a pool deck.",
+)
+
+_POOL_DECK_UNKNOWN = _Verdict(
+    UseCase.pool_deck,
+    ok=None,
+    confidence=0.4,
+    reason="Missing slip or water-resistance data. Confirm outdoor slip rating before installing near pools.",
+)
+
+_POOL_DECK_KEYS = _key_bits(_K_DCOF_V, _K_PLACEMENT, _K_WATER_RES)
 
 
 def check_pool_deck(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _POOL_DECK_KEYS:
+        return _apply(_POOL_DECK_UNKNOWN, detail, _EMPTY_SUPPORTING)
+
+    supporting: List[Tuple[str, str]] = []
 
-    placement = spec_map.get("placement location", "")
-    dcof = spec_map.get("dcof value", "") or spec_map.get("dcof", "")
-    water_resistance = spec_map.get("water resistance", "")
+    placement, placement_low = specs.get(_K_PLACEMENT, _NO_SPEC)
+    dcof = specs.get(_K_DCOF_V, _NO_SPEC)[0]
+    water_resistance = specs.get(_K_WATER_RES, _NO_SPEC)[0]
 
     if placement:
-        supporting["placement location"] = placement
-        if "outdoor" not in placement.lower():
-            return _mk_response(
-                detail,
-                UseCase.pool_deck,
-                ok=False,
-                confidence=0.85,
-                reason="Spec does not list outdoor placement, so a pool deck installation is not recommended.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_PLACEMENT, placement))
+        if "outdoor" not in placement_low:
+            return _apply(_POOL_DECK_NOT_OUTDOOR, detail, supporting)
 
     if water_resistance:
-        supporting["water resistance"] = water_resistance
-        if _contains_any(water_resistance, "not water", "not resistant"):
-            return _mk_response(
-                detail,
-                UseCase.pool_deck,
-                ok=False,
-                confidence=0.95,
-                reason="Spec indicates the product is not water resistant; standing water from a pool deck would damage it.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_WATER_RES, water_resistance))
+        if specs.water_not_resistant:
+            return _apply(_POOL_DECK_NOT_WATER_RESISTANT, detail, supporting)
 
     if dcof:
-        supporting["dcof"] = dcof
+        supporting.append((_K_DCOF, dcof))
         dcof_value = _extract_float(dcof)
         if dcof_value is not None:
             if dcof_value >= 0.42:
-                return _mk_response(
-                    detail,
-                    UseCase.pool_deck,
-                    ok=True,
-                    confidence=0.9,
-                    reason="DCOF rating meets wet-area slip guidance (>= 0.42) and product is rated for outdoor use.",
-                    supporting_specs=supporting,
-                )
-            return _mk_response(
-                detail,
-                UseCase.pool_deck,
-                ok=False,
-                confidence=0.85,
-                reason="DCOF rating below 0.42 indicates the surface may be too slippery for a pool deck.",
-                supporting_specs=supporting,
-            )
-
-    return _mk_response(
-        detail,
-        UseCase.pool_deck,
-        ok=None,
-        confidence=0.4,
-        reason="Missing slip or water-resistance data. Confirm outdoor slip rating before installing near pools.",
-        supporting_specs=supporting,
-    )
+                return _apply(_POOL_DECK_OK, detail, supporting)
+            return _apply(_POOL_DECK_SLIPPERY, detail, supporting)
+
+    return _apply(_POOL_DECK_UNKNOWN, detail, supporting)
+
+
+_BACKSPLASH_FLOOR_ONLY = _Verdict(
+    UseCase.kitchen_backsplash,
+    ok=False,
+    confidence=0.95,
+    reason="Installation options list floor-only coverage, so mounting on a backsplash is not supported.",
+)
+
+_BACKSPLASH_WALL_PLACEMENT = _Verdict(
+    UseCase.kitchen_backsplash,
+    ok=True,
+    confidence=0.75,
+    reason="Spec lists wall installation; ensure finish suits kitchen cleaning needs.",
+)
+
+_BACKSPLASH_WALL_INSTALL = _Verdict(
+    UseCase.kitchen_backsplash,
+    ok=True,
+    confidence=0.85,
+    reason="Installation options explicitly allow wall applications, so a backsplash is supported.",
+)
+
+_BACKSPLASH_NOT_WATER_RESISTANT = _Verdict(
+    UseCase.kitchen_backsplash,
+    ok=False,
+    confidence=0.8,
+    reason="Spec warns the finish is not water resistant — repeated cleaning would damage it.",
+)
+
+_BACKSPLASH_UNKNOWN = _Verdict(
+    UseCase.kitchen_backsplash,
+    ok=None,
+    confidence=0.4,
+    reason="Wall/backsplash install data not found. Verify with manufacturer literature before proceeding.",
+)
+
+_BACKSPLASH_KEYS = _key_bits(_K_INSTALL, _K_PLACEMENT, _K_WATER_RES)
 
 
 def check_kitchen_backsplash(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _BACKSPLASH_KEYS:
+        return _apply(_BACKSPLASH_UNKNOWN, detail, _EMPTY_SUPPORTING)
 
-    install = spec_map.get("installation options", "")
-    placement = spec_map.get("placement location", "")
-    water_resistance = spec_map.get("water resistance", "")
+    supporting: List[Tuple[str, str]] = []
+
+    install, install_low = specs.get(_K_INSTALL, _NO_SPEC)
+    placement, placement_low = specs.get(_K_PLACEMENT, _NO_SPEC)
+    water_resistance = specs.get(_K_WATER_RES, _NO_SPEC)[0]
 
     if install:
-        supporting["installation options"] = install
-        if "floor only" in install.lower():
-            return _mk_response(
-                detail,
-                UseCase.kitchen_backsplash,
-                ok=False,
-                confidence=0.95,
-                reason="Installation options list floor-only coverage, so mounting on a backsplash is not supported.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_INSTALL, install))
+        if "floor only" in install_low:
+            return _apply(_BACKSPLASH_FLOOR_ONLY, detail, supporting)
 
     if placement:
-        supporting["placement location"] = placement
+        supporting.append((_K_PLACEMENT, placement))
 
-    if install and "wall" in install.lower():
-        if placement and "outdoor" in placement.lower():
-            return _mk_response(
-                detail,
-                UseCase.kitchen_backsplash,
-                ok=True,
-                confidence=0.75,
-                reason="Spec lists wall installation; ensure finish suits kitchen cleaning needs.",
-                supporting_specs=supporting,
-            )
-        return _mk_response(
-            detail,
-            UseCase.kitchen_backsplash,
-            ok=True,
-            confidence=0.85,
-            reason="Installation options explicitly allow wall applications, so a backsplash is supported.",
-            supporting_specs=supporting,
-        )
+    if "wall" in install_low:
+        if "outdoor" in placement_low:
+            return _apply(_BACKSPLASH_WALL_PLACEMENT, detail, supporting)
+        return _apply(_BACKSPLASH_WALL_INSTALL, detail, supporting)
 
     if water_resistance:
-        supporting["water resistance"] = water_resistance
-        if _contains_any(water_resistance, "not water", "not resistant"):
-            return _mk_response(
-                detail,
-                UseCase.kitchen_backsplash,
-                ok=False,
-                confidence=0.8,
-                reason="Spec warns the finish is not water resistant — repeated cleaning would damage it.",
-                supporting_specs=supporting,
-            )
-
-    return _mk_response(
-        detail,
-        UseCase.kitchen_backsplash,
-        ok=None,
-        confidence=0.4,
-        reason="Wall/backsplash install data not found. Verify with manufacturer literature before proceeding.",
-        supporting_specs=supporting,
-    )
+        supporting.append((_K_WATER_RES, water_resistance))
+        if specs.water_not_resistant:
+            return _apply(_BACKSPLASH_NOT_WATER_RESISTANT, detail, supporting)
+
+    return _apply(_BACKSPLASH_UNKNOWN, detail, supporting)
+
+
+_COMMERCIAL_HIGH_PEI = _Verdict(
+    UseCase.commercial_heavy_floor,
+    ok=True,
+    confidence=0.9,
+    reason="PEI rating of 4 or 5 supports heavy commercial foot traffic.",
+)
+
+_COMMERCIAL_LOW_PEI = _Verdict(
+    UseCase.commercial_heavy_floor,
+    ok=False,
+    confidence=0.95,
+    reason="PEI rating below 3 is intended for light traffic, not heavy commercial areas.",
+)
+
+_COMMERCIAL_FLOOR_RATED = _Verdict(
+    UseCase.commercial_heavy_floor,
+    ok=True,
+    confidence=0.85,
+    reason="Floor suitability spec explicitly calls out commercial traffic.",
+)
+
+_COMMERCIAL_LIGHT_FLOOR = _Verdict(
+    UseCase.commercial_heavy_floor,
+    ok=False,
+    confidence=0.9,
+    reason="Floor suitability spec limits usage to residential/light areas.",
+)
+
+_COMMERCIAL_UNKNOWN = _Verdict(
+    UseCase.commercial_heavy_floor,
+    ok=None,
+    confidence=0.4,
+    reason="No PEI or floor rating data found. Request traffic rating before commercial installation.",
+)
+
+_COMMERCIAL_KEYS = _key_bits(_K_FLOOR, _K_PEI)
 
 
 def check_commercial_heavy_floor(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _COMMERCIAL_KEYS:
+        return _apply(_COMMERCIAL_UNKNOWN, detail, _EMPTY_SUPPORTING)
 
-    pei = spec_map.get("pei rating", "")
-    floor_rating = spec_map.get("floor suitability rating", "")
+    supporting: List[Tuple[str, str]] = []
+
+    pei = specs.get(_K_PEI, _NO_SPEC)[0]
+    floor_rating, floor_rating_low = specs.get(_K_FLOOR, _NO_SPEC)
 
     if pei:
-        supporting["pei rating"] = pei
+        supporting.append((_K_PEI, pei))
         pei_value = _extract_float(pei)
         if pei_value is not None:
             if pei_value >= 4:
-                return _mk_response(
-                    detail,
-                    UseCase.commercial_heavy_floor,
-                    ok=True,
-                    confidence=0.9,
-                    reason="PEI rating of 4 or 5 supports heavy commercial foot traffic.",
-                    supporting_specs=supporting,
-                )
+                return _apply(_COMMERCIAL_HIGH_PEI, detail, supporting)
             if pei_value <= 2:
-                return _mk_response(
-                    detail,
-                    UseCase.commercial_heavy_floor,
-                    ok=False,
-                    confidence=0.95,
-                    reason="PEI rating below 3 is intended for light traffic, not heavy commercial areas.",
-                    supporting_specs=supporting,
-                )
+                return _apply(_COMMERCIAL_LOW_PEI, detail, supporting)
 
     if floor_rating:
-        supporting["floor suitability rating"] = floor_rating
-        if _contains_any(floor_rating, "heavy commercial", "commercial"):
-            return _mk_response(
-                detail,
-                UseCase.commercial_heavy_floor,
-                ok=True,
-                confidence=0.85,
-                reason="Floor suitability spec explicitly calls out commercial traffic.",
-                supporting_specs=supporting,
-            )
-        if _contains_any(floor_rating, "residential only", "light", "wall only"):
-            return _mk_response(
-                detail,
-                UseCase.commercial_heavy_floor,
-                ok=False,
-                confidence=0.9,
-                reason="Floor suitability spec limits usage to residential/light areas.",
-                supporting_specs=supporting,
-            )
-
-    return _mk_response(
-        detail,
-        UseCase.commercial_heavy_floor,
-        ok=None,
-        confidence=0.4,
-        reason="No PEI or floor rating data found. Request traffic rating before commercial installation.",
-        supporting_specs=supporting,
-    )
+        supporting.append((_K_FLOOR, floor_rating))
+        if _matches(_COMMERCIAL_FLOOR, floor_rating_low):
+            return _apply(_COMMERCIAL_FLOOR_RATED, detail, supporting)
+        if _matches(_LIGHT_FLOOR, floor_rating_low):
+            return _apply(_COMMERCIAL_LIGHT_FLOOR, detail, supporting)
+
+    return _apply(_COMMERCIAL_UNKNOWN, detail, supporting)
+
+
+_LAUNDRY_NOT_WATER_RESISTANT = _Verdict(
+    UseCase.laundry_room_floor,
+    ok=False,
+    confidence=0.9,
+    reason="Spec says the product is not water resistant—laundry leaks would damage it.",
+)
+
+_LAUNDRY_NOT_BATHROOM_SAFE = _Verdict(
+    UseCase.laundry_room_floor,
+    ok=False,
+    confidence=0.9,
+    reason="Bathroom floor spec is negative, so another wet room like a laundry is unsafe.",
+)
+
+_LAUNDRY_BATHROOM_SAFE = _Verdict(
+    UseCase.laundry_room_floor,
+    ok=True,
+    confidence=0.85,
+    reason="Bathroom floor suitability implies it can handle occasional laundry moisture.",
+)
+
+_LAUNDRY_INDOOR = _Verdict(
+    UseCase.laundry_room_floor,
+    ok=True,
+    confidence=0.6,
+    reason="Indoor placement is allowed, but confirm water resistance for laundry spill tolerance.",
+)
+
+_LAUNDRY_UNKNOWN = _Verdict(
+    UseCase.laundry_room_floor,
+    ok=None,
+    confidence=0.3,
+    reason="Could not find wet-area data. Seal or choose a known water-resistant material for laundry rooms.",
+)
+
+_LAUNDRY_KEYS = _key_bits(_K_BATHROOM, _K_PLACEMENT, _K_WATER_RES)
 
 
 def check_laundry_room_floor(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _LAUNDRY_KEYS:
+        return _apply(_LAUNDRY_UNKNOWN, detail, _EMPTY_SUPPORTING)
+
+    supporting: List[Tuple[str, str]] = []
 
-    water = spec_map.get("water resistance", "")
-    bathroom = spec_map.get("bathroom floor use", "")
-    placement = spec_map.get("placement location", "")
+    water = specs.get(_K_WATER_RES, _NO_SPEC)[0]
+    bathroom, bathroom_low = specs.get(_K_BATHROOM, _NO_SPEC)
+    placement, placement_low = specs.get(_K_PLACEMENT, _NO_SPEC)
 
     if water:
-        supporting["water resistance"] = water
-        if _contains_any(water, "not water", "not resistant"):
-            return _mk_response(
-                detail,
-                UseCase.laundry_room_floor,
-                ok=False,
-                confidence=0.9,
-                reason="Spec says the product is not water resistant—laundry leaks would damage it.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_WATER_RES, water))
+        if specs.water_not_resistant:
+            return _apply(_LAUNDRY_NOT_WATER_RESISTANT, detail, supporting)
 
     if bathroom:
-        supporting["bathroom floor use"] = bathroom
-        if _contains_any(bathroom, "not suitable"):
-            return _mk_response(
-                detail,
-                UseCase.laundry_room_floor,
-                ok=False,
-                confidence=0.9,
-                reason="Bathroom floor spec is negative, so another wet room like a laundry is unsafe.",
-                supporting_specs=supporting,
-            )
-        if _contains_any(bathroom, "suitable", "yes"):
-            return _mk_response(
-                detail,
-                UseCase.laundry_room_floor,
-                ok=True,
-                confidence=0.85,
-                reason="Bathroom floor suitability implies it can handle occasional laundry moisture.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_BATHROOM, bathroom))
+        if _matches(_BATHROOM_NEG, bathroom_low):
+            return _apply(_LAUNDRY_NOT_BATHROOM_SAFE, detail, supporting)
+        if _matches(_BATHROOM_POS, bathroom_low):
+            return _apply(_LAUNDRY_BATHROOM_SAFE, detail, supporting)
 
     if placement:
-        supporting["placement location"] = placement
-        if "indoor" in placement.lower():
-            return _mk_response(
-                detail,
-                UseCase.laundry_room_floor,
-                ok=True,
-                confidence=0.6,
-                reason="Indoor placement is allowed, but confirm water resistance for laundry spill tolerance.",
-                supporting_specs=supporting,
-            )
-
-    return _mk_response(
-        detail,
-        UseCase.laundry_room_floor,
-        ok=None,
-        confidence=0.3,
-        reason="Could not find wet-area data. Seal or choose a known water-resistant material for laundry rooms.",
-        supporting_specs=supporting,
-    )
+        supporting.append((_K_PLACEMENT, placement))
+        if "indoor" in placement_low:
+            return _apply(_LAUNDRY_INDOOR, detail, supporting)
+
+    return _apply(_LAUNDRY_UNKNOWN, detail, supporting)
+
+
+_BASEMENT_NOT_INDOOR = _Verdict(
+    UseCase.basement_floor,
+    ok=False,
+    confidence=0.8,
+    reason="Placement spec does not mention indoor/below-grade installs.",
+)
+
+_BASEMENT_NOT_WATER_RESISTANT = _Verdict(
+    UseCase.basement_floor,
+    ok=False,
+    confidence=0.9,
+    reason="Spec says the material lacks water resistance, which is risky for basements.",
+)
+
+_BASEMENT_WATER_RESISTANT = _Verdict(
+    UseCase.basement_floor,
+    ok=True,
+    confidence=0.8,
+    reason="Water-resistance spec supports below-grade moisture swings typical in basements.",
+)
+
+_BASEMENT_LOW_ABSORPTION = _Verdict(
+    UseCase.basement_floor,
+    ok=True,
+    confidence=0.75,
+    reason="Low water absorption (<0.5%) indicates the tile can handle basement humidity.",
+)
+
+_BASEMENT_UNKNOWN = _Verdict(
+    UseCase.basement_floor,
+    ok=None,
+    confidence=0.35,
+    reason="Need water-resistance or absorption data to judge basement suitability.",
+)
+
+_BASEMENT_KEYS = _key_bits(_K_ABSORB, _K_PLACEMENT, _K_WATER_RES)
 
 
 def check_basement_floor(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _BASEMENT_KEYS:
+        return _apply(_BASEMENT_UNKNOWN, detail, _EMPTY_SUPPORTING)
+
+    supporting: List[Tuple[str, str]] = []
 
-    placement = spec_map.get("placement location", "")
-    water = spec_map.get("water resistance", "")
-    absorption = spec_map.get("water absorption", "")
+    placement, placement_low = specs.get(_K_PLACEMENT, _NO_SPEC)
+    water, water_low = specs.get(_K_WATER_RES, _NO_SPEC)
+    absorption = specs.get(_K_ABSORB, _NO_SPEC)[0]
 
     if placement:
-        supporting["placement location"] = placement
-        if "indoor" not in placement.lower():
-            return _mk_response(
-                detail,
-                UseCase.basement_floor,
-                ok=False,
-                confidence=0.8,
-                reason="Placement spec does not mention indoor/below-grade installs.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_PLACEMENT, placement))
+        if "indoor" not in placement_low:
+            return _apply(_BASEMENT_NOT_INDOOR, detail, supporting)
 
     if water:
-        supporting["water resistance"] = water
-        if _contains_any(water, "not water", "not resistant"):
-            return _mk_response(
-                detail,
-                UseCase.basement_floor,
-                ok=False,
-                confidence=0.9,
-                reason="Spec says the material lacks water resistance, which is risky for basements.",
-                supporting_specs=supporting,
-            )
-        if _contains_any(water, "waterproof", "water resistant", "water-resistent"):
-            return _mk_response(
-                detail,
-                UseCase.basement_floor,
-                ok=True,
-                confidence=0.8,
-                reason="Water-resistance spec supports below-grade moisture swings typical in basements.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_WATER_RES, water))
+        if specs.water_not_resistant:
+            return _apply(_BASEMENT_NOT_WATER_RESISTANT, detail, supporting)
+        if _matches(_WATERPROOF, water_low):
+            return _apply(_BASEMENT_WATER_RESISTANT, detail, supporting)
 
     if absorption:
-        supporting["water absorption"] = absorption
+        supporting.append((_K_ABSORB, absorption))
         value = _extract_float(absorption)
         if value is not None and value <= 0.5:
-            return _mk_response(
-                detail,
-                UseCase.basement_floor,
-                ok=True,
-                confidence=0.75,
-                reason="Low water absorption (<0.5%) indicates the tile can handle basement humidity.",
-                supporting_specs=supporting,
-            )
-
-    return _mk_response(
-        detail,
-        UseCase.basement_floor,
-        ok=None,
-        confidence=0.35,
-        reason="Need water-resistance or absorption data to judge basement suitability.",
-        supporting_specs=supporting,
-    )
+            return _apply(_BASEMENT_LOW_ABSORPTION, detail, supporting)
+
+    return _apply(_BASEMENT_UNKNOWN, detail, supporting)
+
+
+_STEAM_NOT_SHOWER_WALL = _Verdict(
+    UseCase.steam_shower_enclosure,
+    ok=False,
+    confidence=0.95,
+    reason="Spec explicitly says the product is not suitable for shower walls.",
+)
+
+_STEAM_HIGH_ABSORPTION = _Verdict(
+    UseCase.steam_shower_enclosure,
+    ok=False,
+    confidence=0.9,
+    reason="Water absorption is high, which risks steam-room saturation.",
+)
+
+_STEAM_NOT_WATER_RESISTANT = _Verdict(
+    UseCase.steam_shower_enclosure,
+    ok=False,
+    confidence=0.9,
+    reason="Spec indicates the material is not water resistant enough for a steam enclosure.",
+)
+
+_STEAM_OK = _Verdict(
+    UseCase.steam_shower_enclosure,
+    ok=True,
+    confidence=0.85,
+    reason="Low water absorption and shower-wall suitability indicate it can handle steam enclosures.",
+)
+
+_STEAM_PARTIAL = _Verdict(
+    UseCase.steam_shower_enclosure,
+    ok=None,
+    confidence=0.5,
+    reason="Missing either dense body or explicit shower-wall approval needed for a steam enclosure.",
+)
+
+_STEAM_UNKNOWN = _Verdict(
+    UseCase.steam_shower_enclosure,
+    ok=None,
+    confidence=0.2,
+    reason="Could not confirm shower-wall suitability or water absorption for steam use.",
+)
+
+_STEAM_KEYS = _key_bits(_K_ABSORB, _K_PLACEMENT, _K_SHOWER, _K_WATER_RES)
 
 
 def check_steam_shower_enclosure(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _STEAM_KEYS:
+        return _apply(_STEAM_UNKNOWN, detail, _EMPTY_SUPPORTING)
 
-    shower_surface = spec_map.get("shower surface", "")
-    water_absorption = spec_map.get("water absorption", "")
-    water_resistance = spec_map.get("water resistance", "")
-    placement = spec_map.get("placement location", "")
+    supporting: List[Tuple[str, str]] = []
+
+    shower_surface, shower_surface_low = specs.get(_K_SHOWER, _NO_SPEC)
+    water_absorption = specs.get(_K_ABSORB, _NO_SPEC)[0]
+    water_resistance = specs.get(_K_WATER_RES, _NO_SPEC)[0]
+    placement = specs.get(_K_PLACEMENT, _NO_SPEC)[0]
 
     wall_ready = False
     if shower_surface:
-        supporting["shower surface"] = shower_surface
-        low = shower_surface.lower()
-        if "not suitable for shower walls" in low:
-            return _mk_response(
-                detail,
-                UseCase.steam_shower_enclosure,
-                ok=False,
-                confidence=0.95,
-                reason="Spec explicitly says the product is not suitable for shower walls.",
-                supporting_specs=supporting,
-            )
-        if "suitable for shower walls" in low or "wet walls" in low:
+        supporting.append((_K_SHOWER, shower_surface))
+        if "not suitable for shower walls" in shower_surface_low:
+            return _apply(_STEAM_NOT_SHOWER_WALL, detail, supporting)
+        if "suitable for shower walls" in shower_surface_low or "wet walls" in shower_surface_low:
             wall_ready = True
 
     dense = False
     if water_absorption:
-        supporting["water absorption"] = water_absorption
+        supporting.append((_K_ABSORB, water_absorption))
         abs_val = _extract_float(water_absorption)
         if abs_val is not None:
             if abs_val <= 0.5:
                 dense = True
             elif abs_val > 3:
-                return _mk_response(
-                    detail,
-                    UseCase.steam_shower_enclosure,
-                    ok=False,
-                    confidence=0.9,
-                    reason="Water absorption is high, which risks steam-room saturation.",
-                    supporting_specs=supporting,
-                )
+                return _apply(_STEAM_HIGH_ABSORPTION, detail, supporting)
 
     if water_resistance:
-        supporting["water resistance"] = water_resistance
-        if _contains_any(water_resistance, "not water", "not resistant", "not recommended"):
-            return _mk_response(
-                detail,
-                UseCase.steam_shower_enclosure,
-                ok=False,
-                confidence=0.9,
-                reason="Spec indicates the material is not water resistant enough for a steam enclosure.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_WATER_RES, water_resistance))
+        if specs.water_negative:
+            return _apply(_STEAM_NOT_WATER_RESISTANT, detail, supporting)
 
     if placement:
-        supporting["placement location"] = placement
+        supporting.append((_K_PLACEMENT, placement))
 
     if wall_ready and dense and water_resistance:
-        return _mk_response(
-            detail,
-            UseCase.steam_shower_enclosure,
-            ok=True,
-            confidence=0.85,
-            reason="Low water absorption and shower-wall suitability indicate it can handle steam enclosures.",
-            supporting_specs=supporting,
-        )
+        return _apply(_STEAM_OK, detail, supporting)
 
     if wall_ready or dense:
-        return _mk_response(
-            detail,
-            UseCase.steam_shower_enclosure,
-            ok=None,
-            confidence=0.5,
-            reason="Missing either dense body or explicit shower-wall approval needed for a steam enclosure.",
-            supporting_specs=supporting,
-        )
-
-    return _mk_response(
-        detail,
-        UseCase.steam_shower_enclosure,
-        ok=None,
-        confidence=0.2,
-        reason="Could not confirm shower-wall suitability or water absorption for steam use.",
-        supporting_specs=supporting,
-    )
+        return _apply(_STEAM_PARTIAL, detail, supporting)
+
+    return _apply(_STEAM_UNKNOWN, detail, supporting)
+
+
+_OUTDOOR_COUNTER_INDOOR_ONLY = _Verdict(
+    UseCase.outdoor_kitchen_counter,
+    ok=False,
+    confidence=0.9,
+    reason="Placement spec restricts installation to indoor areas only.",
+)
+
+_OUTDOOR_COUNTER_NOT_HEAT_SAFE = _Verdict(
+    UseCase.outdoor_kitchen_counter,
+    ok=False,
+    confidence=0.95,
+    reason="Spec indicates it is not safe around fireplace heat, so grills/outdoor kitchens are risky.",
+)
+
+_OUTDOOR_COUNTER_NOT_WATER_RESISTANT = _Verdict(
+    UseCase.outdoor_kitchen_counter,
+    ok=False,
+    confidence=0.9,
+    reason="Spec calls out poor water resistance, which is unsuitable for uncovered outdoor counters.",
+)
+
+_OUTDOOR_COUNTER_OK = _Verdict(
+    UseCase.outdoor_kitchen_counter,
+    ok=True,
+    confidence=0.85,
+    reason="Outdoor placement and fireplace/heat rating suggest it can handle an outdoor kitchen.",
+)
+
+_OUTDOOR_COUNTER_PARTIAL = _Verdict(
+    UseCase.outdoor_kitchen_counter,
+    ok=None,
+    confidence=0.45,
+    reason="Need both outdoor weathering and heat resistance confirmed for an outdoor counter.",
+)
+
+_OUTDOOR_COUNTER_UNKNOWN = _Verdict(
+    UseCase.outdoor_kitchen_counter,
+    ok=None,
+    confidence=0.25,
+    reason="Missing data about outdoor rating and high-heat tolerance for outdoor kitchens.",
+)
+
+_OUTDOOR_COUNTER_KEYS = _key_bits(_K_FIREPLACE, _K_MAT, _K_PLACEMENT, _K_WATER_RES)
 
 
 def check_outdoor_kitchen_counter(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _OUTDOOR_COUNTER_KEYS:
+        return _apply(_OUTDOOR_COUNTER_UNKNOWN, detail, _EMPTY_SUPPORTING)
 
-    placement = spec_map.get("placement location", "")
-    fireplace = spec_map.get("fireplace surround use", "")
-    water_resistance = spec_map.get("water resistance", "")
-    material = spec_map.get("material", "")
+    supporting: List[Tuple[str, str]] = []
+
+    placement, placement_low = specs.get(_K_PLACEMENT, _NO_SPEC)
+    fireplace, fireplace_low = specs.get(_K_FIREPLACE, _NO_SPEC)
+    water_resistance = specs.get(_K_WATER_RES, _NO_SPEC)[0]
+    material = specs.get(_K_MAT, _NO_SPEC)[0]
 
     outdoor_ready = False
     if placement:
-        supporting["placement location"] = placement
-        low = placement.lower()
-        if "indoor only" in low:
-            return _mk_response(
-                detail,
-                UseCase.outdoor_kitchen_counter,
-                ok=False,
-                confidence=0.9,
-                reason="Placement spec restricts installation to indoor areas only.",
-                supporting_specs=supporting,
-            )
-        if "outdoor" in low or "exterior" in low:
+        supporting.append((_K_PLACEMENT, placement))
+        if "indoor only" in placement_low:
+            return _apply(_OUTDOOR_COUNTER_INDOOR_ONLY, detail, supporting)
+        if "outdoor" in placement_low or "exterior" in placement_low:
             outdoor_ready = True
 
     fire_safe = False
     if fireplace:
-        supporting["fireplace surround use"] = fireplace
-        low = fireplace.lower()
-        if "no" in low or "not suitable" in low:
-            return _mk_response(
-                detail,
-                UseCase.outdoor_kitchen_counter,
-                ok=False,
-                confidence=0.95,
-                reason="Spec indicates it is not safe around fireplace heat, so grills/outdoor kitchens are risky.",
-                supporting_specs=supporting,
-            )
-        if "yes" in low or "suitable" in low:
+        supporting.append((_K_FIREPLACE, fireplace))
+        if "no" in fireplace_low or "not suitable" in fireplace_low:
+            return _apply(_OUTDOOR_COUNTER_NOT_HEAT_SAFE, detail, supporting)
+        if "yes" in fireplace_low or "suitable" in fireplace_low:
             fire_safe = True
 
     if water_resistance:
-        supporting["water resistance"] = water_resistance
-        if _contains_any(water_resistance, "not water", "not resistant", "not recommended"):
-            return _mk_response(
-                detail,
-                UseCase.outdoor_kitchen_counter,
-                ok=False,
-                confidence=0.9,
-                reason="Spec calls out poor water resistance, which is unsuitable for uncovered outdoor counters.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_WATER_RES, water_resistance))
+        if specs.water_negative:
+            return _apply(_OUTDOOR_COUNTER_NOT_WATER_RESISTANT, detail, supporting)
 
     if material:
-        supporting["material"] = material
+        supporting.append((_K_MAT, material))
 
     if outdoor_ready and fire_safe:
-        return _mk_response(
-            detail,
-            UseCase.outdoor_kitchen_counter,
-            ok=True,
-            confidence=0.85,
-            reason="Outdoor placement and fireplace/heat rating suggest it can handle an outdoor kitchen.",
-            supporting_specs=supporting,
-        )
+        return _apply(_OUTDOOR_COUNTER_OK, detail, supporting)
 
     if outdoor_ready or fire_safe:
-        return _mk_response(
-            detail,
-            UseCase.outdoor_kitchen_counter,
-            ok=None,
-            confidence=0.45,
-            reason="Need both outdoor weathering and heat resistance confirmed for an outdoor counter.",
-            supporting_specs=supporting,
-        )
-
-    return _mk_response(
-        detail,
-        UseCase.outdoor_kitchen_counter,
-        ok=None,
-        confidence=0.25,
-        reason="Missing data about outdoor rating and high-heat tolerance for outdoor kitchens.",
-        supporting_specs=supporting,
-    )
+        return _apply(_OUTDOOR_COUNTER_PARTIAL, detail, supporting)
+
+    return _apply(_OUTDOOR_COUNTER_UNKNOWN, detail, supporting)
+
+
+_GARAGE_WALL_ONLY = _Verdict(
+    UseCase.garage_workshop_floor,
+    ok=False,
+    confidence=0.95,
+    reason="Placement spec limits this product to walls only, not floors.",
+)
+
+_GARAGE_NO_FLOOR_INSTALL = _Verdict(
+    UseCase.garage_workshop_floor,
+    ok=False,
+    confidence=0.95,
+    reason="Installation options do not include flooring applications.",
+)
+
+_GARAGE_NOT_WATER_RESISTANT = _Verdict(
+    UseCase.garage_workshop_floor,
+    ok=False,
+    confidence=0.9,
+    reason="Spec warns that liquids will damage the surface—garage spills are common.",
+)
+
+_GARAGE_SLIPPERY = _Verdict(
+    UseCase.garage_workshop_floor,
+    ok=False,
+    confidence=0.85,
+    reason="DCOF is below wet-area guidance, making garage slip hazards likely.",
+)
+
+_GARAGE_LOW_PEI = _Verdict(
+    UseCase.garage_workshop_floor,
+    ok=False,
+    confidence=0.9,
+    reason="PEI rating is for light traffic, not the abrasion of a workshop.",
+)
+
+_GARAGE_OK = _Verdict(
+    UseCase.garage_workshop_floor,
+    ok=True,
+    confidence=0.8,
+    reason="Traffic rating and water resistance indicate it can handle garage/workshop abuse.",
+)
+
+_GARAGE_UNKNOWN = _Verdict(
+    UseCase.garage_workshop_floor,
+    ok=None,
+    confidence=0.35,
+    reason="Need high traffic rating, slip data, and water resistance to recommend garages/workshops.",
+)
+
+_GARAGE_KEYS = _key_bits(
+    _K_DCOF_V,
+    _K_FLOOR,
+    _K_INSTALL,
+    _K_PEI,
+    _K_PLACEMENT,
+    _K_WATER_RES,
+)
 
 
 def check_garage_workshop_floor(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _GARAGE_KEYS:
+        return _apply(_GARAGE_UNKNOWN, detail, _EMPTY_SUPPORTING)
+
+    supporting: List[Tuple[str, str]] = []
 
-    placement = spec_map.get("placement location", "")
-    installation = spec_map.get("installation options", "")
-    water_resistance = spec_map.get("water resistance", "")
-    pei = spec_map.get("pei rating", "")
-    floor_rating = spec_map.get("floor suitability rating", "")
-    dcof = spec_map.get("dcof value", "") or spec_map.get("dcof", "")
+    placement, placement_low = specs.get(_K_PLACEMENT, _NO_SPEC)
+    installation, installation_low = specs.get(_K_INSTALL, _NO_SPEC)
+    water_resistance = specs.get(_K_WATER_RES, _NO_SPEC)[0]
+    pei = specs.get(_K_PEI, _NO_SPEC)[0]
+    floor_rating, floor_rating_low = specs.get(_K_FLOOR, _NO_SPEC)
+    dcof = specs.get(_K_DCOF_V, _NO_SPEC)[0]
 
     if placement:
-        supporting["placement location"] = placement
-        if "wall only" in placement.lower():
-            return _mk_response(
-                detail,
-                UseCase.garage_workshop_floor,
-                ok=False,
-                confidence=0.95,
-                reason="Placement spec limits this product to walls only, not floors.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_PLACEMENT, placement))
+        if "wall only" in placement_low:
+            return _apply(_GARAGE_WALL_ONLY, detail, supporting)
 
     if installation:
-        supporting["installation options"] = installation
-        if "wall only" in installation.lower():
-            return _mk_response(
-                detail,
-                UseCase.garage_workshop_floor,
-                ok=False,
-                confidence=0.95,
-                reason="Installation options do not include flooring applications.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_INSTALL, installation))
+        if "wall only" in installation_low:
+            return _apply(_GARAGE_NO_FLOOR_INSTALL, detail, supporting)
 
     if water_resistance:
-        supporting["water resistance"] = water_resistance
-        if _contains_any(water_resistance, "not water", "not resistant", "not recommended"):
-            return _mk_response(
-                detail,
-                UseCase.garage_workshop_floor,
-                ok=False,
-                confidence=0.9,
-                reason="Spec warns that liquids will damage the surface—garage spills are common.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_WATER_RES, water_resistance))
+        if specs.water_negative:
+            return _apply(_GARAGE_NOT_WATER_RESISTANT, detail, supporting)
 
+    dcof_val = _extract_float(dcof)
     if dcof:
-        supporting["dcof"] = dcof
-        value = _extract_float(dcof)
-        if value is not None and value < 0.42:
-            return _mk_response(
-                detail,
-                UseCase.garage_workshop_floor,
-                ok=False,
-                confidence=0.85,
-                reason="DCOF is below wet-area guidance, making garage slip hazards likely.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_DCOF, dcof))
+        if dcof_val is not None and dcof_val < 0.42:
+            return _apply(_GARAGE_SLIPPERY, detail, supporting)
 
     heavy_rating = False
     if floor_rating:
-        supporting["floor suitability rating"] = floor_rating
-        if _contains_any(floor_rating, "heavy", "commercial", "garage"):
+        supporting.append((_K_FLOOR, floor_rating))
+        if _matches(_HEAVY_FLOOR, floor_rating_low):
             heavy_rating = True
 
     pei_ready = False
     if pei:
-        supporting["pei rating"] = pei
+        supporting.append((_K_PEI, pei))
         pei_val = _extract_float(pei)
         if pei_val is not None and pei_val >= 4:
             pei_ready = True
         elif pei_val is not None and pei_val <= 2:
-            return _mk_response(
-                detail,
-                UseCase.garage_workshop_floor,
-                ok=False,
-                confidence=0.9,
-                reason="PEI rating is for light traffic, not the abrasion of a workshop.",
-                supporting_specs=supporting,
-            )
-
-    if (pei_ready or heavy_rating) and water_resistance and (not dcof or _extract_float(dcof) is None or _extract_float(dcof) >= 0.42):
-        return _mk_response(
-            detail,
-            UseCase.garage_workshop_floor,
-            ok=True,
-            confidence=0.8,
-            reason="Traffic rating and water resistance indicate it can handle garage/workshop abuse.",
-            supporting_specs=supporting,
-        )
+            return _apply(_GARAGE_LOW_PEI, detail, supporting)
 
-    return _mk_response(
-        detail,
-        UseCase.garage_workshop_floor,
-        ok=None,
-        confidence=0.35,
-        reason="Need high traffic rating, slip data, and water resistance to recommend garages/workshops.",
-        supporting_specs=supporting,
-    )
+    if (pei_ready or heavy_rating) and water_resistance and (dcof_val is None or dcof_val >= 0.42):
+        return _apply(_GARAGE_OK, detail, supporting)
+
+    return _apply(_GARAGE_UNKNOWN, detail, supporting)
+
+
+_DRIVEWAY_INDOOR_ONLY = _Verdict(
+    UseCase.driveway_paver,
+    ok=False,
+    confidence=0.9,
+    reason="Placement spec restricts use to indoor areas.",
+)
+
+_DRIVEWAY_TOO_THIN = _Verdict(
+    UseCase.driveway_paver,
+    ok=False,
+    confidence=0.9,
+    reason="Product thickness is under 1\", which is too thin for vehicle loads.",
+)
+
+_DRIVEWAY_NOT_FROST_RESISTANT = _Verdict(
+    UseCase.driveway_paver,
+    ok=False,
+    confidence=0.9,
+    reason="Spec indicates the paver is not frost resistant, which a driveway requires.",
+)
+
+_DRIVEWAY_OK = _Verdict(
+    UseCase.driveway_paver,
+    ok=True,
+    confidence=0.85,
+    reason="Thickness and freeze-thaw data indicate it can support vehicle traffic.",
+)
+
+_DRIVEWAY_UNKNOWN = _Verdict(
+    UseCase.driveway_paver,
+    ok=None,
+    confidence=0.35,
+    reason="Need outdoor rating plus thick, frost-resistant specs to approve driveway installs.",
+)
+
+_DRIVEWAY_KEYS = _key_bits(_K_ABSORB, _K_FROST, _K_PLACEMENT, _K_THICK)
 
 
 def check_driveway_paver(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _DRIVEWAY_KEYS:
+        return _apply(_DRIVEWAY_UNKNOWN, detail, _EMPTY_SUPPORTING)
+
+    supporting: List[Tuple[str, str]] = []
 
-    placement = spec_map.get("placement location", "")
-    thickness = spec_map.get("product thickness", "")
-    frost = spec_map.get("frost resistance", "")
-    water_absorption = spec_map.get("water absorption", "")
+    placement, placement_low = specs.get(_K_PLACEMENT, _NO_SPEC)
+    thickness = specs.get(_K_THICK, _NO_SPEC)[0]
+    frost = specs.get(_K_FROST, _NO_SPEC)[0]
+    water_absorption = specs.get(_K_ABSORB, _NO_SPEC)[0]
 
     outdoor_ready = False
     if placement:
-        supporting["placement location"] = placement
-        low = placement.lower()
-        if "indoor only" in low:
-            return _mk_response(
-                detail,
-                UseCase.driveway_paver,
-                ok=False,
-                confidence=0.9,
-                reason="Placement spec restricts use to indoor areas.",
-                supporting_specs=supporting,
-            )
-        if "outdoor" in low or "exterior" in low:
+        supporting.append((_K_PLACEMENT, placement))
+        if "indoor only" in placement_low:
+            return _apply(_DRIVEWAY_INDOOR_ONLY, detail, supporting)
+        if "outdoor" in placement_low or "exterior" in placement_low:
             outdoor_ready = True
 
     thickness_val = None
     if thickness:
-        supporting["product thickness"] = thickness
+        supporting.append((_K_THICK, thickness))
         thickness_val = _extract_float(thickness)
         if thickness_val is not None and thickness_val < 1:
-            return _mk_response(
-                detail,
-                UseCase.driveway_paver,
-                ok=False,
-                confidence=0.9,
-                reason="Product thickness is under 1\", which is too thin for vehicle loads.",
-                supporting_specs=supporting,
-            )
+            return _apply(_DRIVEWAY_TOO_THIN, detail, supporting)
 
     frost_ok = False
     if frost:
-        supporting["frost resistance"] = frost
-        if _contains_any(frost, "no", "not resistant"):
-            return _mk_response(
-                detail,
-                UseCase.driveway_paver,
-                ok=False,
-                confidence=0.9,
-                reason="Spec indicates the paver is not frost resistant, which a driveway requires.",
-                supporting_specs=supporting,
-            )
-        if _contains_any(frost, "yes", "resistant", "rated"):
+        supporting.append((_K_FROST, frost))
+        if specs.frost_negative:
+            return _apply(_DRIVEWAY_NOT_FROST_RESISTANT, detail, supporting)
+        if specs.frost_positive:
             frost_ok = True
 
     dense = False
     if water_absorption:
-        supporting["water absorption"] = water_absorption
+        supporting.append((_K_ABSORB, water_absorption))
         abs_val = _extract_float(water_absorption)
         if abs_val is not None and abs_val <= 0.5:
             dense = True
 
     if outdoor_ready and thickness_val is not None and thickness_val >= 1.25 and (frost_ok or dense):
-        return _mk_response(
-            detail,
-            UseCase.driveway_paver,
-            ok=True,
-            confidence=0.85,
-            reason="Thickness and freeze-thaw data indicate it can support vehicle traffic.",
-            supporting_specs=supporting,
-        )
+        return _apply(_DRIVEWAY_OK, detail, supporting)
 
-    return _mk_response(
-        detail,
-        UseCase.driveway_paver,
-        ok=None,
-        confidence=0.35,
-        reason="Need outdoor rating plus thick, frost-resistant specs to approve driveway installs.",
-        supporting_specs=supporting,
-    )
+    return _apply(_DRIVEWAY_UNKNOWN, detail, supporting)
+
+
+_STAIR_WALL_ONLY = _Verdict(
+    UseCase.stair_tread,
+    ok=False,
+    confidence=0.9,
+    reason="Installation options call out wall-only applications, not stairs.",
+)
+
+_STAIR_TOO_THIN = _Verdict(
+    UseCase.stair_tread,
+    ok=False,
+    confidence=0.85,
+    reason="Material thinner than 0.3\" is prone to breaking on stair nosings.",
+)
+
+_STAIR_NO_FOOT_TRAFFIC = _Verdict(
+    UseCase.stair_tread,
+    ok=False,
+    confidence=0.9,
+    reason="Floor suitability rating does not allow foot traffic needed for stairs.",
+)
+
+_STAIR_OK = _Verdict(
+    UseCase.stair_tread,
+    ok=True,
+    confidence=0.7,
+    reason="Installation options include floors and thickness appears adequate for stair nosings.",
+)
+
+_STAIR_UNKNOWN = _Verdict(
+    UseCase.stair_tread,
+    ok=None,
+    confidence=0.3,
+    reason="Need explicit stair trim or structural thickness to confirm suitability.",
+)
+
+_STAIR_KEYS = _key_bits(_K_FLOOR, _K_INSTALL, _K_PLACEMENT, _K_THICK)
 
 
 def check_stair_tread(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _STAIR_KEYS:
+        return _apply(_STAIR_UNKNOWN, detail, _EMPTY_SUPPORTING)
 
-    installation = spec_map.get("installation options", "")
-    placement = spec_map.get("placement location", "")
-    thickness = spec_map.get("product thickness", "")
-    floor_rating = spec_map.get("floor suitability rating", "")
+    supporting: List[Tuple[str, str]] = []
+
+    installation, installation_low = specs.get(_K_INSTALL, _NO_SPEC)
+    placement = specs.get(_K_PLACEMENT, _NO_SPEC)[0]
+    thickness = specs.get(_K_THICK, _NO_SPEC)[0]
+    floor_rating, floor_rating_low = specs.get(_K_FLOOR, _NO_SPEC)
 
     floor_allowed = False
     if installation:
-        supporting["installation options"] = installation
-        low = installation.lower()
-        if "wall only" in low:
-            return _mk_response(
-                detail,
-                UseCase.stair_tread,
-                ok=False,
-                confidence=0.9,
-                reason="Installation options call out wall-only applications, not stairs.",
-                supporting_specs=supporting,
-            )
-        if "floor" in low:
+        supporting.append((_K_INSTALL, installation))
+        if "wall only" in installation_low:
+            return _apply(_STAIR_WALL_ONLY, detail, supporting)
+        if "floor" in installation_low:
             floor_allowed = True
 
     if placement:
-        supporting["placement location"] = placement
+        supporting.append((_K_PLACEMENT, placement))
 
     thickness_val = None
     if thickness:
-        supporting["product thickness"] = thickness
+        supporting.append((_K_THICK, thickness))
         thickness_val = _extract_float(thickness)
         if thickness_val is not None and thickness_val < 0.3:
-            return _mk_response(
-                detail,
-                UseCase.stair_tread,
-                ok=False,
-                confidence=0.85,
-                reason="Material thinner than 0.3\" is prone to breaking on stair nosings.",
-                supporting_specs=supporting,
-            )
+            return _apply(_STAIR_TOO_THIN, detail, supporting)
 
     if floor_rating:
-        supporting["floor suitability rating"] = floor_rating
-        if _contains_any(floor_rating, "wall only", "light wall"):
-            return _mk_response(
-                detail,
-                UseCase.stair_tread,
-                ok=False,
-                confidence=0.9,
-                reason="Floor suitability rating does not allow foot traffic needed for stairs.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_FLOOR, floor_rating))
+        if _matches(_WALL_ONLY_FLOOR, floor_rating_low):
+            return _apply(_STAIR_NO_FOOT_TRAFFIC, detail, supporting)
 
     if floor_allowed and (thickness_val is None or thickness_val >= 0.375):
-        return _mk_response(
-            detail,
-            UseCase.stair_tread,
-            ok=True,
-            confidence=0.7,
-            reason="Installation options include floors and thickness appears adequate for stair nosings.",
-            supporting_specs=supporting,
-        )
-
-    return _mk_response(
-        detail,
-        UseCase.stair_tread,
-        ok=None,
-        confidence=0.3,
-        reason="Need explicit stair trim or structural thickness to confirm suitability.",
-        supporting_specs=supporting,
-    )
+        return _apply(_STAIR_OK, detail, supporting)
+
+    return _apply(_STAIR_UNKNOWN, detail, supporting)
+
+
+_COMMERCIAL_KITCHEN_WOOD = _Verdict(
+    UseCase.commercial_kitchen_floor,
+    ok=False,
+    confidence=0.95,
+    reason="Wood/bio-based materials are not recommended for wet, greasy commercial kitchens.",
+)
+
+_COMMERCIAL_KITCHEN_NOT_WATER_RESISTANT = _Verdict(
+    UseCase.commercial_kitchen_floor,
+    ok=False,
+    confidence=0.9,
+    reason="Spec says the surface does not tolerate water/chemicals—bad fit for commercial kitchens.",
+)
+
+_COMMERCIAL_KITCHEN_SLIPPERY = _Verdict(
+    UseCase.commercial_kitchen_floor,
+    ok=False,
+    confidence=0.9,
+    reason="DCOF is below the 0.50 wet-slip guideline for commercial kitchens.",
+)
+
+_COMMERCIAL_KITCHEN_LOW_PEI = _Verdict(
+    UseCase.commercial_kitchen_floor,
+    ok=False,
+    confidence=0.9,
+    reason="PEI rating is too light for high-traffic commercial kitchens.",
+)
+
+_COMMERCIAL_KITCHEN_LIGHT_FLOOR = _Verdict(
+    UseCase.commercial_kitchen_floor,
+    ok=False,
+    confidence=0.9,
+    reason="Floor suitability rating limits the product to residential/light use.",
+)
+
+_COMMERCIAL_KITCHEN_OK = _Verdict(
+    UseCase.commercial_kitchen_floor,
+    ok=True,
+    confidence=0.85,
+    reason="Traffic, slip, and water-resistance specs align with commercial kitchen demands.",
+)
+
+_COMMERCIAL_KITCHEN_UNKNOWN = _Verdict(
+    UseCase.commercial_kitchen_floor,
+    ok=None,
+    confidence=0.35,
+    reason="Need explicit commercial traffic, slip, and water-proof specs for kitchen approval.",
+)
+
+_COMMERCIAL_KITCHEN_KEYS = _key_bits(
+    _K_DCOF_V,
+    _K_FLOOR,
+    _K_MAT,
+    _K_PEI,
+    _K_WATER_RES,
+)
 
 
 def check_commercial_kitchen_floor(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _COMMERCIAL_KITCHEN_KEYS:
+        return _apply(_COMMERCIAL_KITCHEN_UNKNOWN, detail, _EMPTY_SUPPORTING)
 
-    water_resistance = spec_map.get("water resistance", "")
-    pei = spec_map.get("pei rating", "")
-    floor_rating = spec_map.get("floor suitability rating", "")
-    dcof = spec_map.get("dcof value", "") or spec_map.get("dcof", "")
-    material = spec_map.get("material", "")
+    supporting: List[Tuple[str, str]] = []
+
+    water_resistance = specs.get(_K_WATER_RES, _NO_SPEC)[0]
+    pei = specs.get(_K_PEI, _NO_SPEC)[0]
+    floor_rating, floor_rating_low = specs.get(_K_FLOOR, _NO_SPEC)
+    dcof = specs.get(_K_DCOF_V, _NO_SPEC)[0]
+    material, material_low = specs.get(_K_MAT, _NO_SPEC)
 
     if material:
-        supporting["material"] = material
-        if _contains_any(material, "wood", "bamboo", "cork"):
-            return _mk_response(
-                detail,
-                UseCase.commercial_kitchen_floor,
-                ok=False,
-                confidence=0.95,
-                reason="Wood/bio-based materials are not recommended for wet, greasy commercial kitchens.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_MAT, material))
+        if _matches(_WOOD_MATERIAL, material_low):
+            return _apply(_COMMERCIAL_KITCHEN_WOOD, detail, supporting)
 
     if water_resistance:
-        supporting["water resistance"] = water_resistance
-        if _contains_any(water_resistance, "not water", "not resistant", "not recommended"):
-            return _mk_response(
-                detail,
-                UseCase.commercial_kitchen_floor,
-                ok=False,
-                confidence=0.9,
-                reason="Spec says the surface does not tolerate water/chemicals—bad fit for commercial kitchens.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_WATER_RES, water_resistance))
+        if specs.water_negative:
+            return _apply(_COMMERCIAL_KITCHEN_NOT_WATER_RESISTANT, detail, supporting)
 
+    dcof_val = _extract_float(dcof)
     if dcof:
-        supporting["dcof"] = dcof
-        value = _extract_float(dcof)
-        if value is not None and value < 0.5:
-            return _mk_response(
-                detail,
-                UseCase.commercial_kitchen_floor,
-                ok=False,
-                confidence=0.9,
-                reason="DCOF is below the 0.50 wet-slip guideline for commercial kitchens.",
-                supporting_specs=supporting,
-            )
+        supporting.append((_K_DCOF, dcof))
+        if dcof_val is not None and dcof_val < 0.5:
+            return _apply(_COMMERCIAL_KITCHEN_SLIPPERY, detail, supporting)
 
     pei_ready = False
     if pei:
-        supporting["pei rating"] = pei
+        supporting.append((_K_PEI, pei))
         pei_val = _extract_float(pei)
         if pei_val is not None and pei_val >= 4:
             pei_ready = True
         elif pei_val is not None and pei_val <= 2:
-            return _mk_response(
-                detail,
-                UseCase.commercial_kitchen_floor,
-                ok=False,
-                confidence=0.9,
-                reason="PEI rating is too light for high-traffic commercial kitchens.",
-                supporting_specs=supporting,
-            )
+            return _apply(_COMMERCIAL_KITCHEN_LOW_PEI, detail, supporting)
 
     commercial_flag = False
     if floor_rating:
-        supporting["floor suitability rating"] = floor_rating
-        if _contains_any(floor_rating, "commercial", "heavy", "restaurant"):
+        supporting.append((_K_FLOOR, floor_rating))
+        if _matches(_RESTAURANT_FLOOR, floor_rating_low):
             commercial_flag = True
-        if _contains_any(floor_rating, "residential only", "wall"):
-            return _mk_response(
-                detail,
-                UseCase.commercial_kitchen_floor,
-                ok=False,
-                confidence=0.9,
-                reason="Floor suitability rating limits the product to residential/light use.",
-                supporting_specs=supporting,
-            )
-
-    if pei_ready and commercial_flag and (not dcof or _extract_float(dcof) is None or _extract_float(dcof) >= 0.5):
-        return _mk_response(
-            detail,
-            UseCase.commercial_kitchen_floor,
-            ok=True,
-            confidence=0.85,
-            reason="Traffic, slip, and water-resistance specs align with commercial kitchen demands.",
-            supporting_specs=supporting,
-        )
+        if _matches(_RESIDENTIAL_OR_WALL_FLOOR, floor_rating_low):
+            return _apply(_COMMERCIAL_KITCHEN_LIGHT_FLOOR, detail, supporting)
+
+    if pei_ready and commercial_flag and (dcof_val is None or dcof_val >= 0.5):
+        return _apply(_COMMERCIAL_KITCHEN_OK, detail, supporting)
+
+    return _apply(_COMMERCIAL_KITCHEN_UNKNOWN, detail, supporting)
 
-    return _mk_response(
-        detail,
-        UseCase.commercial_kitchen_floor,
-        ok=None,
-        confidence=0.35,
-        reason="Need explicit commercial traffic, slip, and water-proof specs for kitchen approval.",
-        supporting_specs=supporting,
-    )
+
+_POOL_INTERIOR_HIGH_ABSORPTION = _Verdict(
+    UseCase.pool_interior,
+    ok=False,
+    confidence=0.95,
+    reason="Water absorption is too high for constant submersion.",
+)
+
+_POOL_INTERIOR_NOT_WATER_RESISTANT = _Verdict(
+    UseCase.pool_interior,
+    ok=False,
+    confidence=0.9,
+    reason="Spec explicitly says it is not water resistant—cannot be submerged.",
+)
+
+_POOL_INTERIOR_NOT_FROST_RESISTANT = _Verdict(
+    UseCase.pool_interior,
+    ok=False,
+    confidence=0.9,
+    reason="Lack of frost resistance risks cracking in freeze/thaw pool environments.",
+)
+
+_POOL_INTERIOR_OK = _Verdict(
+    UseCase.pool_interior,
+    ok=True,
+    confidence=0.8,
+    reason="Low absorption and water/frost resistance indicate it can stay submerged.",
+)
+
+_POOL_INTERIOR_UNKNOWN = _Verdict(
+    UseCase.pool_interior,
+    ok=None,
+    confidence=0.3,
+    reason="Need dense body and submersion-rated specs to approve pool interiors.",
+)
+
+_POOL_INTERIOR_KEYS = _key_bits(_K_ABSORB, _K_FROST, _K_PLACEMENT, _K_WATER_RES)
 
 
 def check_pool_interior(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _POOL_INTERIOR_KEYS:
+        return _apply(_POOL_INTERIOR_UNKNOWN, detail, _EMPTY_SUPPORTING)
+
+    supporting: List[Tuple[str, str]] = []
 
-    water_absorption = spec_map.get("water absorption", "")
-    water_resistance = spec_map.get("water resistance", "")
-    placement = spec_map.get("placement location", "")
-    frost = spec_map.get("frost resistance", "")
+    water_absorption = specs.get(_K_ABSORB, _NO_SPEC)[0]
+    water_resistance = specs.get(_K_WATER_RES, _NO_SPEC)[0]
+    placement, placement_low = specs.get(_K_PLACEMENT, _NO_SPEC)
+    frost = specs.get(_K_FROST, _NO_SPEC)[0]
 
     if water_absorption:
-        supporting["water absorption"] = water_absorption
+        supporting.append((_K_ABSORB, water_absorption))
         abs_val = _extract_float(water_absorption)
         if abs_val is not None and abs_val > 3:
-            return _mk_response(
-                detail,
-                UseCase.pool_interior,
-                ok=False,
-                confidence=0.95,
-                reason="Water absorption is too high for constant submersion.",
-                supporting_specs=supporting,
-            )
+            return _apply(_POOL_INTERIOR_HIGH_ABSORPTION, detail, supporting)
         if abs_val is not None and abs_val <= 0.5:
             dense = True
         else:
@@ -1252,145 +1578,123 @@ def check_pool_interior(detail: ProductDetail) -> UsageCheckResponse:
     else:
         dense = False
 
+    water_positive = False
     if water_resistance:
-        supporting["water resistance"] = water_resistance
-        if _contains_any(water_resistance, "not water", "not resistant", "not recommended"):
-            return _mk_response(
-                detail,
-                UseCase.pool_interior,
-                ok=False,
-                confidence=0.9,
-                reason="Spec explicitly says it is not water resistant—cannot be submerged.",
-                supporting_specs=supporting,
-            )
-    water_positive = water_resistance != "" and not _contains_any(
-        water_resistance, "not water", "not resistant", "not recommended"
-    )
+        supporting.append((_K_WATER_RES, water_resistance))
+        if specs.water_negative:
+            return _apply(_POOL_INTERIOR_NOT_WATER_RESISTANT, detail, supporting)
+        water_positive = True
 
     exterior_flag = False
     if placement:
-        supporting["placement location"] = placement
-        if "outdoor" in placement.lower() or "exterior" in placement.lower():
+        supporting.append((_K_PLACEMENT, placement))
+        if "outdoor" in placement_low or "exterior" in placement_low:
             exterior_flag = True
 
     frost_ok = False
     if frost:
-        supporting["frost resistance"] = frost
-        if _contains_any(frost, "no", "not resistant"):
-            return _mk_response(
-                detail,
-                UseCase.pool_interior,
-                ok=False,
-                confidence=0.9,
-                reason="Lack of frost resistance risks cracking in freeze/thaw pool environments.",
-                supporting_specs=supporting,
-            )
-        if _contains_any(frost, "yes", "resistant", "rated"):
+        supporting.append((_K_FROST, frost))
+        if specs.frost_negative:
+            return _apply(_POOL_INTERIOR_NOT_FROST_RESISTANT, detail, supporting)
+        if specs.frost_positive:
             frost_ok = True
 
     if dense and water_positive and (frost_ok or exterior_flag):
-        return _mk_response(
-            detail,
-            UseCase.pool_interior,
-            ok=True,
-            confidence=0.8,
-            reason="Low absorption and water/frost resistance indicate it can stay submerged.",
-            supporting_specs=supporting,
-        )
-
-    return _mk_response(
-        detail,
-        UseCase.pool_interior,
-        ok=None,
-        confidence=0.3,
-        reason="Need dense body and submersion-rated specs to approve pool interiors.",
-        supporting_specs=supporting,
-    )
+        return _apply(_POOL_INTERIOR_OK, detail, supporting)
+
+    return _apply(_POOL_INTERIOR_UNKNOWN, detail, supporting)
+
+
+_CLADDING_INDOOR_ONLY = _Verdict(
+    UseCase.exterior_wall_cladding,
+    ok=False,
+    confidence=0.9,
+    reason="Placement spec restricts the product to interior installs.",
+)
+
+_CLADDING_FLOOR_ONLY = _Verdict(
+    UseCase.exterior_wall_cladding,
+    ok=False,
+    confidence=0.9,
+    reason="Installation options limit to floors, not wall cladding.",
+)
+
+_CLADDING_NOT_FROST_RESISTANT = _Verdict(
+    UseCase.exterior_wall_cladding,
+    ok=False,
+    confidence=0.9,
+    reason="Spec indicates it cannot handle freeze/thaw on exterior walls.",
+)
+
+_CLADDING_NOT_WATER_RESISTANT = _Verdict(
+    UseCase.exterior_wall_cladding,
+    ok=False,
+    confidence=0.9,
+    reason="Spec indicates poor water resistance—exterior exposure would cause failure.",
+)
+
+_CLADDING_OK = _Verdict(
+    UseCase.exterior_wall_cladding,
+    ok=True,
+    confidence=0.8,
+    reason="Outdoor placement plus wall installation instructions indicate façade suitability.",
+)
+
+_CLADDING_UNKNOWN = _Verdict(
+    UseCase.exterior_wall_cladding,
+    ok=None,
+    confidence=0.35,
+    reason="Need explicit wall install + exterior/frost-resistant specs to approve façade use.",
+)
+
+_CLADDING_KEYS = _key_bits(_K_FROST, _K_INSTALL, _K_PLACEMENT, _K_WATER_RES)
 
 
 def check_exterior_wall_cladding(detail: ProductDetail) -> UsageCheckResponse:
-    spec_map = build_spec_map(detail)
-    supporting: Dict[str, str] = {}
+    specs = _cached_spec_index(detail)
+    if not specs.present & _CLADDING_KEYS:
+        return _apply(_CLADDING_UNKNOWN, detail, _EMPTY_SUPPORTING)
 
-    placement = spec_map.get("placement location", "")
-    installation = spec_map.get("installation options", "")
-    frost = spec_map.get("frost resistance", "")
-    water_resistance = spec_map.get("water resistance", "")
+    supporting: List[Tuple[str, str]] = []
+
+    placement, placement_low = specs.get(_K_PLACEMENT, _NO_SPEC)
+    installation, installation_low = specs.get(_K_INSTALL, _NO_SPEC)
+    frost = specs.get(_K_FROST, _NO_SPEC)[0]
+    water_resistance = specs.get(_K_WATER_RES, _NO_SPEC)[0]
 
     outdoor_flag = False
     if placement:
-        supporting["placement location"] = placement
-        low = placement.lower()
-        if "indoor only" in low:
-            return _mk_response(
-                detail,
-                UseCase.exterior_wall_cladding,
-                ok=False,
-                confidence=0.9,
-                reason="Placement spec restricts the product to interior installs.",
-                supporting_specs=supporting,
-            )
-        if "outdoor" in low or "exterior" in low:
+        supporting.append((_K_PLACEMENT, placement))
+        if "indoor only" in placement_low:
+            return _apply(_CLADDING_INDOOR_ONLY, detail, supporting)
+        if "outdoor" in placement_low or "exterior" in placement_low:
             outdoor_flag = True
 
     wall_flag = False
     if installation:
-        supporting["installation options"] = installation
-        low = installation.lower()
-        if "wall" in low:
+        supporting.append((_K_INSTALL, installation))
+        if "wall" in installation_low:
             wall_flag = True
-        if "floor only" in low:
-            return _mk_response(
-                detail,
-                UseCase.exterior_wall_cladding,
-                ok=False,
-                confidence=0.9,
-                reason="Installation options limit to floors, not wall cladding.",
-                supporting_specs=supporting,
-            )
+        if "floor only" in installation_low:
+            return _apply(_CLADDING_FLOOR_ONLY, detail, supporting)
 
+    # A frost spec that is present must be positive; a missing one is allowed.
+    frost_present = False
     frost_ok = False
     if frost:
-        supporting["frost resistance"] = frost
-        if _contains_any(frost, "no", "not resistant"):
-            return _mk_response(
-                detail,
-                UseCase.exterior_wall_cladding,
-                ok=False,
-                confidence=0.9,
-                reason="Spec indicates it cannot handle freeze/thaw on exterior walls.",
-                supporting_specs=supporting,
-            )
-        if _contains_any(frost, "yes", "resistant", "rated"):
+        frost_present = True
+        supporting.append((_K_FROST, frost))
+        if specs.frost_negative:
+            return _apply(_CLADDING_NOT_FROST_RESISTANT, detail, supporting)
+        if specs.frost_positive:
             frost_ok = True
 
     if water_resistance:
-        supporting["water resistance"] = water_resistance
-        if _contains_any(water_resistance, "not water", "not resistant", "not recommended"):
-            return _mk_response(
-                detail,
-                UseCase.exterior_wall_cladding,
-                ok=False,
-                confidence=0.9,
-                reason="Spec indicates poor water resistance—exterior exposure would cause failure.",
-                supporting_specs=supporting,
-            )
-
-    if outdoor_flag and wall_flag and (frost_ok or not frost):
-        return _mk_response(
-            detail,
-            UseCase.exterior_wall_cladding,
-            ok=True,
-            confidence=0.8,
-            reason="Outdoor placement plus wall installation instructions indicate façade suitability.",
-            supporting_specs=supporting,
-        )
+        supporting.append((_K_WATER_RES, water_resistance))
+        if specs.water_negative:
+            return _apply(_CLADDING_NOT_WATER_RESISTANT, detail, supporting)
 
-    return _mk_response(
-        detail,
-        UseCase.exterior_wall_cladding,
-        ok=None,
-        confidence=0.35,
-        reason="Need explicit wall install + exterior/frost-resistant specs to approve façade use.",
-        supporting_specs=supporting,
-    )
+    if outdoor_flag and wall_flag and (frost_ok or not frost_present):
+        return _apply(_CLADDING_OK, detail, supporting)
+
+    return _apply(_CLADDING_UNKNOWN, detail, supporting)
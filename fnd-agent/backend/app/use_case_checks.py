@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Callable, Dict
+from typing import Callable, Dict, Tuple
 
 from . import rules_engine
 from .models import ProductDetail, UsageCheckResponse, UseCase
@@ -27,3 +27,17 @@ USE_CASE_CHECKERS: Dict[UseCase, Callable[[ProductDetail], UsageCheckResponse]]
     UseCase.exterior_wall_cladding: rules_engine.check_exterior_wall_cladding,
 }
 
+
+# Frozen (use_case, checker) pairs for sweeps over every use case, so they
+# iterate a tuple instead of re-walking the dict's items view each call.
+_CHECKER_ITEMS: Tuple[Tuple[UseCase, Callable[[ProductDetail], UsageCheckResponse]], ...] = tuple(
+    USE_CASE_CHECKERS.items()
+)
+
+
+def evaluate_all(detail: ProductDetail) -> Dict[UseCase, UsageCheckResponse]:
+    """
+    Run every use-case checker against one product. The checkers share the
+    spec index cached for ``detail``, so it is only built once per sweep.
+    """
+    return {use_case: checker(detail) for use_case, checker in _CHECKER_ITEMS}
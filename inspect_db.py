@@ -24,7 +24,14 @@ if db_path is None:
 
 print("\nUsing DB:", db_path.resolve())
 
-conn = sqlite3.connect(db_path)
+# Read-only: this is an inspection tool and must never modify the DB.
+conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+conn.executescript(
+    """
+    PRAGMA query_only = ON;
+    PRAGMA cache_size = -65536;
+    """
+)
 cur = conn.cursor()
 
 # List tables
@@ -39,10 +46,16 @@ else:
 
 # Row counts
 print("\n=== ROW COUNTS ===")
-for t in tables:
-    cur.execute(f"SELECT COUNT(*) FROM {t}")
-    count = cur.fetchone()[0]
-    print(f"  {t}: {count} rows")
+if tables:
+    # One round-trip for all tables instead of a COUNT query per table.
+    cur.execute(
+        "SELECT "
+        + ", ".join(
+            '(SELECT COUNT(*) FROM "{}")'.format(t.replace('"', '""')) for t in tables
+        )
+    )
+    for t, count in zip(tables, cur.fetchone()):
+        print(f"  {t}: {count} rows")
 
 # Sample products
 if "products" in tables:
@@ -3,7 +3,7 @@
 scrape_products.py
 
 Scrape Floor & Decor product metadata & rich details (DCOF, specs,
-install docs, recommended materials) for a single store, and store
+install docs, recommended materials) for one or more stores, and store
 everything in a normalized SQLite database.
 
 This is the *offline* data-population step for your FND Agent:
@@ -19,7 +19,10 @@ Usage examples (from repo root, with your venv activated):
     # Scrape another store into the same DB (will reuse rows by SKU)
     python scrape_products.py --store-id 999
 
-    # Customize DB path and scrape TTL (re-scrape anything older than 3 days)
+    # Scrape several stores concurrently into the same DB
+    python scrape_products.py --store-id 238,999
+
+    # Customize DB path and scrape TTL (new SKUs go stale after 3 days)
     python scrape_products.py --store-id 238 --db data/fnd_products.db --ttl-days 3
 
 Schema (created automatically if missing):
@@ -27,15 +30,16 @@ Schema (created automatically if missing):
     products(
         sku TEXT PRIMARY KEY,
         name TEXT,
-        url TEXT UNIQUE,
+        url TEXT,                -- UNIQUE via idx_products_url
         category_slug TEXT,
         price_per_sqft TEXT,
         price_per_box TEXT,
         size_primary TEXT,
         color TEXT,
         finish TEXT,
-        store_id INTEGER,
-        last_scraped_at TEXT
+        store_id INTEGER,        -- store that last wrote the row
+        last_scraped_at TEXT,
+        content_hash TEXT        -- digest of the row's content (content_hash())
     )
 
     product_specs(
@@ -60,27 +64,74 @@ Schema (created automatically if missing):
         rec_sku TEXT
     )
 
-NOTE: Right now SKU is treated as global-primary-key. If you later need
-true multi-store pricing/availability per SKU in one DB, you can split
-into a global product table + a store_products table keyed by (sku, store_id).
+    product_scrape_state(        -- re-scrape bookkeeping, per store
+        sku TEXT,
+        store_id INTEGER,
+        last_scraped_at TEXT,
+        ttl_seconds REAL,        -- adaptive interval (see next_ttl)
+        content_hash TEXT,       -- hash of the page this store last saw
+        etag TEXT,               -- validators for the next conditional GET
+        last_modified TEXT,
+        PRIMARY KEY (sku, store_id)
+    )
+
+Indexes: product_documents(sku) and product_recommended_items(sku), plus
+the unique idx_products_url, which is built at the end of the first scrape
+into an empty DB (see ensure_url_index) rather than maintained row by row.
+
+NOTE: Right now SKU is treated as global-primary-key: stores sharing a SKU
+share its products row, and only the scrape bookkeeping is kept per store.
+If you later need true multi-store pricing/availability per SKU in one DB,
+you can split into a global product table + a store_products table keyed by
+(sku, store_id).
 """
 
 from __future__ import annotations
 
 import argparse
+import codecs
+import hashlib
 import logging
+import multiprocessing
+import os
+import queue
 import re
 import sqlite3
 import sys
+import threading
 import time
+from collections import Counter, deque
+from contextlib import nullcontext
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import (
+    ContextManager,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup, NavigableString, Tag
+from lxml import etree
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ---------------------- CONSTANTS ----------------------
 
@@ -97,16 +148,45 @@ CATEGORY_SLUGS = [
 # Where the SQLite DB lives by default
 DEFAULT_DB_PATH = Path("data") / "fnd_products.db"
 
+# Pages are parsed straight into lxml (libxml2) trees and queried with
+# precompiled XPath, so the tree walks run in C rather than in Python.
+
 REQUEST_TIMEOUT = 15
 SLEEP_BETWEEN_REQUESTS = 0.5  # politeness
 MAX_PAGES_PER_CATEGORY = 10_000  # safety valve
 
+# Product pages fetched/parsed concurrently. Fetching is network-bound, so
+# threads overlap the waits; all SQLite writes go through one writer thread.
+DEFAULT_WORKERS = 8
+
+# Adaptive re-scrape interval bounds (see next_ttl). --max-ttl-days caps
+# the interval a run honours, not the one a SKU has earned.
+MIN_TTL = timedelta(hours=1)
+MAX_TTL = timedelta(days=90)
+DEFAULT_MAX_TTL_DAYS = 7.0
+
+# Parsed products buffered before they are written in one transaction.
+WRITE_BATCH_SIZE = 500
+# Results the writer thread can fall behind by before the scrape loop waits,
+# and the longest a partial batch sits uncommitted.
+WRITE_QUEUE_SIZE = 1024
+WRITE_FLUSH_SECONDS = 2.0
+
 # Product detail URLs look like:
 #   https://www.flooranddecor.com/porcelain-tile/alto-bianco-porcelain-tile-101053254.html
 PRODUCT_URL_RE = re.compile(
-    r"https://www\.flooranddecor\.com/[A-Za-z0-9_\-/]+-(\d{6,})\.html"
+    r"https://www\.flooranddecor\.com/[A-Za-z0-9_\-/]+-(?:\d{6,})\.html"
 )
 
+CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+
+SKU_TEXT_RE = re.compile(r"SKU[:\s]+(\d{6,})")
+SKU_URL_RE = re.compile(r"-(\d{6,})\.html")
+
+# The "SKU: ..." line sits in the product header, near the start of the
+# flattened page text; look there before scanning the whole page.
+SKU_SEARCH_WINDOW = 4096
+
 # Category / URL substrings we want to completely avoid crawling
 EXCLUDE_CATEGORY_SUBSTRINGS = [
     # Big buckets
@@ -204,6 +284,15 @@ EXCLUDE_PRODUCT_NAME_TOKENS = [
     "cabinet pull",
 ]
 
+# The exclusion lists as single alternations: one regex scan per URL / name
+# instead of one substring scan per entry. Matched against lowercased text.
+EXCLUDE_CATEGORY_RE = re.compile(
+    "|".join(re.escape(sub) for sub in EXCLUDE_CATEGORY_SUBSTRINGS)
+)
+EXCLUDE_PRODUCT_NAME_RE = re.compile(
+    "|".join(re.escape(tok) for tok in EXCLUDE_PRODUCT_NAME_TOKENS)
+)
+
 # Labels we care about from spec-like sections
 SPEC_LABELS = [
     # Dimensions
@@ -240,6 +329,16 @@ SPEC_LABELS = [
     "Fireplace Surround Use",
 ]
 
+# All spec labels as one pattern, matched against lowercased page text. The
+# alternation sits inside a lookahead so overlapping occurrences are reported
+# too ("Size" inside "Suggested Grout Line Size"). No label is a prefix of
+# another, so at most one alternative can match at any position.
+_SPEC_LABEL_BY_LOWER: Dict[str, str] = {label.lower(): label for label in SPEC_LABELS}
+SPEC_LABEL_RE = re.compile(
+    "(?=(" + "|".join(re.escape(low) for low in _SPEC_LABEL_BY_LOWER) + "))"
+)
+_WHITESPACE_RUN_RE = re.compile(r"\s{2,}")
+
 
 # ---------------------- DATA CLASSES ----------------------
 
@@ -256,6 +355,77 @@ class ProductBasic:
     color: Optional[str]
     finish: Optional[str]
     store_id: Optional[int] = None
+    # Set by scrape_store before writing (see plan_next_scrape).
+    content_hash: Optional[str] = None
+    ttl_seconds: Optional[float] = None
+    # Cache validators from the product page response.
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+@dataclass
+class ScrapedProduct:
+    """Everything parsed from one product page, ready to be written."""
+
+    basic: ProductBasic
+    specs: Dict[str, str]
+    docs: List[Tuple[str, str]]
+    recs: List[Tuple[str, str]]
+
+
+@dataclass
+class ScrapeState:
+    """
+    What the DB remembers about a SKU: this store's previous scrape of it
+    (product_scrape_state) and the hash of the products row, which any
+    store may have written last.
+    """
+
+    last_scraped_at: Optional[datetime]
+    ttl: Optional[timedelta]
+    content_hash: Optional[str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    row_hash: Optional[str] = None
+
+
+@dataclass
+class NotModified:
+    """A conditional GET came back 304: the stored product is still current."""
+
+    sku: str
+
+
+class ScrapeStateRow(NamedTuple):
+    """One store's bookkeeping for a SKU after a scrape (see save_scrape_state)."""
+
+    sku: str
+    store_id: int
+    ttl_seconds: Optional[float]
+    content_hash: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class CheckpointMark(NamedTuple):
+    """
+    Queued to the writer thread once every URL before ``offset`` has had its
+    result queued; when the writer reaches it, the offset is safe to save.
+    """
+
+    offset: int
+
+
+WriteItem = Union[ScrapedProduct, ScrapeStateRow, CheckpointMark]
+
+
+@dataclass
+class WriterStats:
+    """Row counts from the writer thread, and the error that stopped it."""
+
+    scraped: int = 0
+    unchanged: int = 0
+    error: Optional[Exception] = None
 
 
 # ---------------------- LOGGING ----------------------
@@ -275,13 +445,27 @@ def init_db(db_path: Path) -> sqlite3.Connection:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(str(db_path))
     conn.execute("PRAGMA foreign_keys = ON;")
+    # WAL + synchronous=NORMAL: one fsync per checkpoint instead of two per
+    # commit, and the API can keep reading while a scrape is writing. The
+    # default autocheckpoint (1000 pages) keeps checkpoints small; the size
+    # limit shrinks the WAL file back to 64 MB after one resets it.
+    conn.executescript(
+        """
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -65536;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA journal_size_limit = 67108864;
+        """
+    )
     cur = conn.cursor()
     cur.executescript(
         """
         CREATE TABLE IF NOT EXISTS products (
             sku TEXT PRIMARY KEY,
             name TEXT,
-            url TEXT UNIQUE,
+            url TEXT,
             category_slug TEXT,
             price_per_sqft TEXT,
             price_per_box TEXT,
@@ -289,7 +473,8 @@ def init_db(db_path: Path) -> sqlite3.Connection:
             color TEXT,
             finish TEXT,
             store_id INTEGER,
-            last_scraped_at TEXT
+            last_scraped_at TEXT,
+            content_hash TEXT
         );
 
         CREATE TABLE IF NOT EXISTS product_specs (
@@ -316,39 +501,183 @@ def init_db(db_path: Path) -> sqlite3.Connection:
             rec_sku TEXT,
             FOREIGN KEY (sku) REFERENCES products(sku) ON DELETE CASCADE
         );
+
+        -- Every write deletes a product's rows by sku before reinserting
+        -- them, and the API loads them by sku; without these both scan the
+        -- whole table.
+        CREATE INDEX IF NOT EXISTS idx_product_documents_sku
+            ON product_documents(sku);
+        CREATE INDEX IF NOT EXISTS idx_product_recommended_items_sku
+            ON product_recommended_items(sku);
         """
     )
     conn.commit()
+    migrate_products_table(conn)
+    create_scrape_state_table(conn)
+    # Loading into an empty table is cheaper without the url index; it is
+    # built once at the end of scrape_store. Tables that already hold rows
+    # get it now so their urls stay protected.
+    if conn.execute("SELECT 1 FROM products LIMIT 1").fetchone():
+        ensure_url_index(conn)
     return conn
 
 
-def get_existing_last_scraped(conn: sqlite3.Connection, sku: str) -> Optional[datetime]:
-    cur = conn.cursor()
-    cur.execute("SELECT last_scraped_at FROM products WHERE sku = ?", (sku,))
-    row = cur.fetchone()
-    if not row or not row[0]:
-        return None
+def migrate_products_table(conn: sqlite3.Connection) -> None:
+    """Add columns introduced after a DB was created."""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(products)")}
+    added = {
+        "content_hash": "TEXT",
+    }
+    with conn:
+        for column, decl in added.items():
+            if column not in existing:
+                conn.execute(f"ALTER TABLE products ADD COLUMN {column} {decl}")
+
+
+def create_scrape_state_table(conn: sqlite3.Connection) -> None:
+    """
+    Create product_scrape_state: freshness, TTL, content hash and cache
+    validators per (sku, store_id), so stores sharing a SKU don't overwrite
+    each other's. A DB from before it existed gets it seeded from products,
+    keeping each row fresh for the store that scraped it.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master "
+        "WHERE type = 'table' AND name = 'product_scrape_state'"
+    ).fetchone()
+    if exists:
+        return
+    # Older DBs kept the TTL and validators on products itself. Their
+    # content hashes also covered store_id, so they aren't carried over.
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(products)")}
+    carried = "".join(
+        f", {column}"
+        for column in ("ttl_seconds", "etag", "last_modified")
+        if column in existing
+    )
+    with conn:
+        conn.execute(
+            """
+            CREATE TABLE product_scrape_state (
+                sku TEXT NOT NULL,
+                store_id INTEGER NOT NULL,
+                last_scraped_at TEXT,
+                ttl_seconds REAL,
+                content_hash TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                PRIMARY KEY (sku, store_id)
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO product_scrape_state "
+            f"(sku, store_id, last_scraped_at{carried}) "
+            f"SELECT sku, store_id, last_scraped_at{carried} FROM products "
+            "WHERE store_id IS NOT NULL AND last_scraped_at IS NOT NULL"
+        )
+
+
+def ensure_url_index(conn: sqlite3.Connection) -> None:
+    """
+    Make products.url unique. Databases created before the index was deferred
+    already have it as a table constraint; leave those alone rather than
+    maintaining a second index.
+    """
+    for _, name, unique, *_ in conn.execute("PRAGMA index_list(products)"):
+        if not unique:
+            continue
+        cols = [r[2] for r in conn.execute(f"PRAGMA index_info({name})")]
+        if cols == ["url"]:
+            return
+    with conn:
+        conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_products_url ON products(url)"
+        )
+
+
+def parse_scraped_at(value: str) -> Optional[datetime]:
+    """
+    Parse a stored last_scraped_at as an aware UTC datetime. Rows written
+    before timestamps carried an offset are naive UTC; treat them as such.
+    """
     try:
-        return datetime.fromisoformat(row[0])
+        ts = datetime.fromisoformat(value)
     except Exception:
         return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts
 
 
-def upsert_product(conn: sqlite3.Connection, basic: ProductBasic) -> None:
-    if basic.sku is None:
-        raise ValueError(f"Missing SKU for product URL={basic.url}")
+def load_scrape_state(
+    conn: sqlite3.Connection,
+    store_id: int,
+    skus: Iterable[str],
+    chunk_size: int = 500,
+) -> Dict[str, ScrapeState]:
+    """
+    State for many SKUs as seen from one store, fetched with chunked IN (...)
+    queries instead of one SELECT per SKU. SKUs without a products row are
+    left out; last_scraped_at is None where this store hasn't scraped the
+    SKU (or its timestamp doesn't parse).
+    """
+    wanted = list(skus)
+    result: Dict[str, ScrapeState] = {}
+    for i in range(0, len(wanted), chunk_size):
+        chunk = wanted[i : i + chunk_size]
+        placeholders = ", ".join("?" * len(chunk))
+        rows = conn.execute(
+            "SELECT p.sku, p.content_hash, s.last_scraped_at, s.ttl_seconds, "
+            "s.content_hash, s.etag, s.last_modified "
+            "FROM products p LEFT JOIN product_scrape_state s "
+            "ON s.sku = p.sku AND s.store_id = ? "
+            f"WHERE p.sku IN ({placeholders})",
+            [store_id, *chunk],
+        )
+        for sku, row_hash, value, ttl_seconds, content_hash, etag, modified in rows:
+            ts = parse_scraped_at(value) if value else None
+            ttl = timedelta(seconds=ttl_seconds) if ttl_seconds is not None else None
+            result[sku] = ScrapeState(
+                ts, ttl, content_hash, etag, modified, row_hash=row_hash
+            )
+    return result
+
 
-    now_iso = datetime.utcnow().isoformat()
-    logging.info("Upserting product SKU=%s", basic.sku)
-    conn.execute(
+def upsert_products(conn: sqlite3.Connection, basics: Sequence[ProductBasic]) -> None:
+    rows = []
+    # One timestamp for the whole batch.
+    now_iso = datetime.now(timezone.utc).isoformat()
+    for basic in basics:
+        if basic.sku is None:
+            raise ValueError(f"Missing SKU for product URL={basic.url}")
+        logging.info("Upserting product SKU=%s", basic.sku)
+        rows.append(
+            (
+                basic.sku,
+                basic.name,
+                basic.url,
+                basic.category_slug,
+                basic.price_per_sqft,
+                basic.price_per_box,
+                basic.size_primary,
+                basic.color,
+                basic.finish,
+                basic.store_id,
+                now_iso,
+                basic.content_hash,
+            )
+        )
+    conn.executemany(
         """
         INSERT INTO products (
             sku, name, url, category_slug,
             price_per_sqft, price_per_box,
             size_primary, color, finish,
-            store_id, last_scraped_at
+            store_id, last_scraped_at,
+            content_hash
         )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ON CONFLICT(sku) DO UPDATE SET
             name = excluded.name,
             url = excluded.url,
@@ -359,74 +688,163 @@ def upsert_product(conn: sqlite3.Connection, basic: ProductBasic) -> None:
             color = excluded.color,
             finish = excluded.finish,
             store_id = excluded.store_id,
-            last_scraped_at = excluded.last_scraped_at;
+            last_scraped_at = excluded.last_scraped_at,
+            content_hash = COALESCE(excluded.content_hash, products.content_hash);
         """,
+        rows,
+    )
+    save_scrape_state(
+        conn,
         (
-            basic.sku,
-            basic.name,
-            basic.url,
-            basic.category_slug,
-            basic.price_per_sqft,
-            basic.price_per_box,
-            basic.size_primary,
-            basic.color,
-            basic.finish,
-            basic.store_id,
-            now_iso,
+            ScrapeStateRow(
+                basic.sku,
+                basic.store_id,
+                basic.ttl_seconds,
+                basic.content_hash,
+                basic.etag,
+                basic.last_modified,
+            )
+            for basic in basics
+            if basic.store_id is not None
         ),
+        now_iso,
     )
-    conn.commit()
 
 
-def save_specs(conn: sqlite3.Connection, sku: str, specs: Dict[str, str]) -> None:
-    logging.info("  -> specs: %d entries", len(specs))
+def save_scrape_state(
+    conn: sqlite3.Connection, rows: Iterable[ScrapeStateRow], now_iso: str
+) -> None:
+    """
+    Upsert per-store bookkeeping. A None TTL or hash keeps the stored one;
+    validators are replaced as given.
+    """
+    conn.executemany(
+        """
+        INSERT INTO product_scrape_state (
+            sku, store_id, last_scraped_at, ttl_seconds,
+            content_hash, etag, last_modified
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(sku, store_id) DO UPDATE SET
+            last_scraped_at = excluded.last_scraped_at,
+            ttl_seconds = COALESCE(excluded.ttl_seconds, ttl_seconds),
+            content_hash = COALESCE(excluded.content_hash, content_hash),
+            etag = excluded.etag,
+            last_modified = excluded.last_modified;
+        """,
+        (
+            (
+                row.sku,
+                row.store_id,
+                now_iso,
+                row.ttl_seconds,
+                row.content_hash,
+                row.etag,
+                row.last_modified,
+            )
+            for row in rows
+        ),
+    )
+
+
+def mark_unchanged(conn: sqlite3.Connection, rows: Sequence[ScrapeStateRow]) -> int:
+    """
+    Record re-checks that found a product unchanged (a 304, or a page whose
+    content hash matches the stored row): only last_scraped_at and the
+    store's bookkeeping move, and specs / docs / recommendations aren't
+    rewritten. Returns the number of rows.
+    """
+    if not rows:
+        return 0
+    now_iso = datetime.now(timezone.utc).isoformat()
+    with conn:
+        conn.executemany(
+            "UPDATE products SET last_scraped_at = ? WHERE sku = ?",
+            ((now_iso, row.sku) for row in rows),
+        )
+        save_scrape_state(conn, rows, now_iso)
+    return len(rows)
+
+
+def save_specs(
+    conn: sqlite3.Connection, specs_by_sku: Dict[str, Dict[str, str]]
+) -> None:
     cur = conn.cursor()
-    cur.execute("DELETE FROM product_specs WHERE sku = ?", (sku,))
+    cur.executemany(
+        "DELETE FROM product_specs WHERE sku = ?", ((sku,) for sku in specs_by_sku)
+    )
     cur.executemany(
         "INSERT INTO product_specs (sku, spec_key, spec_value) VALUES (?, ?, ?)",
-        [(sku, key, value) for key, value in specs.items()],
+        (
+            (sku, key, value)
+            for sku, specs in specs_by_sku.items()
+            for key, value in specs.items()
+        ),
     )
-    conn.commit()
 
 
 def save_docs(
-    conn: sqlite3.Connection, sku: str, docs: List[Tuple[str, str]]
+    conn: sqlite3.Connection, docs_by_sku: Dict[str, List[Tuple[str, str]]]
 ) -> None:
-    logging.info("  -> docs: %d links", len(docs))
     cur = conn.cursor()
-    cur.execute("DELETE FROM product_documents WHERE sku = ?", (sku,))
+    cur.executemany(
+        "DELETE FROM product_documents WHERE sku = ?",
+        ((sku,) for sku in docs_by_sku),
+    )
     cur.executemany(
         "INSERT INTO product_documents (sku, doc_label, doc_url) VALUES (?, ?, ?)",
-        [(sku, label, href) for (label, href) in docs],
+        (
+            (sku, label, href)
+            for sku, docs in docs_by_sku.items()
+            for (label, href) in docs
+        ),
     )
-    conn.commit()
 
 
 def save_recommended(
-    conn: sqlite3.Connection, sku: str, recs: List[Tuple[str, str]]
+    conn: sqlite3.Connection, recs_by_sku: Dict[str, List[Tuple[str, str]]]
 ) -> None:
-    logging.info("  -> recommended: %d items", len(recs))
     cur = conn.cursor()
-    cur.execute("DELETE FROM product_recommended_items WHERE sku = ?", (sku,))
-    rows = []
-    for name, href in recs:
-        rec_sku = extract_sku_from_url(href)
-        rows.append((sku, name, href, rec_sku))
+    cur.executemany(
+        "DELETE FROM product_recommended_items WHERE sku = ?",
+        ((sku,) for sku in recs_by_sku),
+    )
     cur.executemany(
         """
         INSERT INTO product_recommended_items (sku, rec_name, rec_url, rec_sku)
         VALUES (?, ?, ?, ?)
         """,
-        rows,
+        (
+            (sku, name, href, extract_sku_from_url(href))
+            for sku, recs in recs_by_sku.items()
+            for name, href in recs
+        ),
     )
-    conn.commit()
 
 
 # ---------------------- HTTP / STORE CONTEXT ----------------------
 
 
-def make_session() -> requests.Session:
+def make_session(pool_maxsize: int = 64) -> requests.Session:
     s = requests.Session()
+    # Keep-alive pool sized at or above the worker count so concurrent
+    # fetches reuse connections instead of re-doing TCP/TLS handshakes (a
+    # smaller pool silently discards the extra connections). Everything goes
+    # to one or two hosts, so only a few per-host pools are kept. Transient
+    # 429/5xx responses are retried with backoff; after the last retry the
+    # response is returned as-is and logged by the caller.
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
     s.headers.update(
         {
             "User-Agent": (
@@ -436,6 +854,8 @@ def make_session() -> requests.Session:
             ),
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
         }
     )
     return s
@@ -459,13 +879,95 @@ def set_store_context(session: requests.Session, store_id: int) -> None:
 # ---------------------- DISCOVERY HELPERS ----------------------
 
 
+# Plain strings (no back-reference keeping the whole tree alive).
+_ANCHOR_HREFS = etree.XPath("//a/@href", smart_strings=False)
+
+# Text that counts as page content: comments and script / style / template
+# bodies are skipped.
+_NON_TEXT_TAGS = ("script", "style", "template")
+_VISIBLE_TEXT = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]",
+    smart_strings=False,
+)
+# A template's own text still leaves out scripts and styles nested in it.
+_TEMPLATE_TEXT = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style)]", smart_strings=False
+)
+
+# First text or comment node mentioning the pickup block. Smart strings, so
+# the hit can be traced back to its element.
+_PICKUP_NODE = etree.XPath(
+    "(//text() | //comment())[contains(., 'In-Store Pickup')][1]"
+)
+_FIRST_H1 = etree.XPath("(//h1)[1]")
+_OG_TITLE = etree.XPath("(//meta[@property='og:title'])[1]")
+
+
+def response_encoding(r: requests.Response) -> str:
+    """
+    Charset from the Content-Type header, else UTF-8 (what flooranddecor.com
+    serves). Used instead of r.text, which falls back to ISO-8859-1 for a
+    bare text/html and may run charset detection over the whole body.
+    """
+    m = CHARSET_RE.search(r.headers.get("Content-Type", ""))
+    if m:
+        try:
+            return codecs.lookup(m.group(1)).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+def parse_html(content: bytes, encoding: str) -> lxml_html.HtmlElement:
+    """
+    Parse a page body into an lxml tree. A parser is built per call because
+    lxml parser objects must not be shared between threads.
+    """
+    parser = lxml_html.HTMLParser(encoding=encoding)
+    try:
+        return lxml_html.document_fromstring(content, parser=parser)
+    except etree.ParserError:
+        # Empty body: behave like an empty page.
+        return lxml_html.document_fromstring("<html></html>")
+
+
+def element_text(el: lxml_html.HtmlElement, separator: str = " ") -> str:
+    """
+    Text of an element, each string stripped and empties dropped, joined by
+    ``separator`` (what BeautifulSoup's get_text(separator, strip=True) gave).
+    Comments and script / style / template contents are left out unless
+    ``el`` is itself one of those tags.
+    """
+    if el.tag == "template":
+        strings = _TEMPLATE_TEXT(el)
+    elif el.tag in _NON_TEXT_TAGS:
+        strings = [el.text or ""]
+    else:
+        strings = _VISIBLE_TEXT(el)
+    return separator.join(s for s in (t.strip() for t in strings) if s)
+
+
+def anchor_hrefs(html: str) -> List[str]:
+    """
+    Return the href of every <a> on the page. Listing pages only need their
+    anchors, so this asks libxml2 for them directly.
+    """
+    try:
+        return _ANCHOR_HREFS(lxml_html.document_fromstring(html))
+    except etree.ParserError:
+        return []  # empty body
+    except ValueError:
+        # A str carrying an XML encoding declaration; parse the bytes instead.
+        return _ANCHOR_HREFS(parse_html(html.encode("utf-8"), "utf-8"))
+
+
 def url_is_excluded(url: str) -> bool:
     """
     Return True if this URL looks like an installation-material / vanity /
     countertop / door / hardware thing that we don't want.
     """
     path = urlparse(url).path.lower()
-    return any(bad in path for bad in EXCLUDE_CATEGORY_SUBSTRINGS)
+    return EXCLUDE_CATEGORY_RE.search(path) is not None
 
 
 def discover_category_slugs(session: requests.Session) -> List[str]:
@@ -491,7 +993,7 @@ def discover_category_slugs(session: requests.Session) -> List[str]:
         logging.warning("Failed to fetch sitemap %s: %s", sitemap_url, e)
         return sorted(slugs)
 
-    soup = BeautifulSoup(r.text, "html.parser")
+    html = r.content.decode(response_encoding(r), errors="replace")
 
     category_keywords = [
         "tile",
@@ -507,8 +1009,8 @@ def discover_category_slugs(session: requests.Session) -> List[str]:
         "backsplash",
     ]
 
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
+    for href in anchor_hrefs(html):
+        href = href.strip()
         if not href:
             continue
         # Only internal paths
@@ -526,7 +1028,7 @@ def discover_category_slugs(session: requests.Session) -> List[str]:
         low = path.lower()
 
         # Skip explicit "bad" categories globally
-        if any(bad in low for bad in EXCLUDE_CATEGORY_SUBSTRINGS):
+        if EXCLUDE_CATEGORY_RE.search(low):
             continue
 
         # Skip obvious leaf product pages
@@ -557,13 +1059,15 @@ def fetch_product_urls_for_category(
     """
     start_url = urljoin(BASE_URL, category_slug)
     visited: Set[str] = set()
-    to_visit: List[str] = [start_url]
+    to_visit: deque[str] = deque([start_url])
     found_urls: Set[str] = set()
+    seen_bodies: Set[bytes] = set()
 
     cat_token = category_slug.strip("/").split("/")[0].lower() if category_slug else ""
+    slug_low = category_slug.lower()
 
     while to_visit and len(visited) < MAX_PAGES_PER_CATEGORY:
-        url = to_visit.pop(0)
+        url = to_visit.popleft()
         if url in visited:
             continue
         visited.add(url)
@@ -587,22 +1091,42 @@ def fetch_product_urls_for_category(
             )
             continue
 
-        html = r.text
+        # Pagination past the last page and many filter combinations serve
+        # a body we've already processed; its links are all handled.
+        digest = hashlib.blake2b(r.content, digest_size=16).digest()
+        if digest in seen_bodies:
+            logging.info("  -> Same content as an earlier page, skipping")
+            continue
+        seen_bodies.add(digest)
+
+        html = r.content.decode(response_encoding(r), errors="replace")
 
-        # Collect product URLs from this page
-        for match in PRODUCT_URL_RE.finditer(html):
-            full_url = match.group(0)
+        # Collect product URLs from this page. PRODUCT_URL_RE has no groups,
+        # so findall returns the URLs themselves.
+        for full_url in set(PRODUCT_URL_RE.findall(html)) - found_urls:
             if url_is_excluded(full_url):
                 continue
             found_urls.add(full_url)
 
         # Discover more listing pages to crawl
-        soup = BeautifulSoup(html, "html.parser")
-        for a in soup.find_all("a", href=True):
-            href = a["href"].strip()
+        for href in anchor_hrefs(html):
+            href = href.strip()
             if not href or href.startswith("#"):
                 continue
-            if href.lower().startswith("javascript:"):
+            href_low = href.lower()
+            if href_low.startswith("javascript:"):
+                continue
+
+            # Does this look like a listing/filter/search page? Same slug
+            # (/tile, /tile/..., /tile?... etc.) or category token in query
+            # path (/search?cgid=tile-xxx, etc.), and not in a "bad" section.
+            is_listing = (
+                slug_low in href_low or bool(cat_token and cat_token in href_low)
+            ) and not EXCLUDE_CATEGORY_RE.search(href_low)
+
+            # Only an href with ".html" can resolve to a product URL, so the
+            # rest can be dropped here without resolving it.
+            if not is_listing and ".html" not in href:
                 continue
 
             full = urljoin(BASE_URL, href)
@@ -620,26 +1144,8 @@ def fetch_product_urls_for_category(
                     found_urls.add(full)
                 continue
 
-            href_low = href.lower()
-
-            # Don't even walk into "bad" sections
-            if any(bad in href_low for bad in EXCLUDE_CATEGORY_SUBSTRINGS):
-                continue
-
-            # Decide if this looks like a listing/filter/search page
-            in_same_family = False
-
-            # Same slug (/tile, /tile/..., /tile?... etc.)
-            if category_slug.lower() in href_low:
-                in_same_family = True
-            # Or category token in query path (/search?cgid=tile-xxx, etc.)
-            elif cat_token and cat_token in href_low:
-                in_same_family = True
-
-            if not in_same_family:
-                continue
-
-            to_visit.append(full)
+            if is_listing:
+                to_visit.append(full)
 
         time.sleep(SLEEP_BETWEEN_REQUESTS)
 
@@ -656,7 +1162,7 @@ def fetch_product_urls_for_category(
 # ---------------------- AVAILABILITY FILTER ----------------------
 
 
-def is_available_in_store(soup: BeautifulSoup) -> bool:
+def is_available_in_store(doc: lxml_html.HtmlElement) -> bool:
     """
     Heuristically determine if the product is actually stocked at the current store
     (after set_store_context has been called).
@@ -667,22 +1173,24 @@ def is_available_in_store(soup: BeautifulSoup) -> bool:
         'not available at this store', 'online only', etc -> treat as NOT stocked.
       - Otherwise, keep it.
     """
-    pickup_node = soup.find(
-        string=lambda t: isinstance(t, NavigableString)
-        and "In-Store Pickup" in t
-    )
+    found = _PICKUP_NODE(doc)
 
     # If we can't find it, don't over-filter; assume it's fine
-    if not pickup_node:
+    if not found:
         return True
 
-    # Walk up ancestors to find the "card" that contains the pickup text
-    current: Optional[Tag] = pickup_node.parent
+    # Walk up ancestors to find the "card" that contains the pickup text.
+    # A text hit is a smart string: getparent() is the element it belongs to,
+    # or, for tail text, the element it follows.
+    node = found[0]
+    current: Optional[lxml_html.HtmlElement] = node.getparent()
+    if isinstance(node, str) and node.is_tail and current is not None:
+        current = current.getparent()
     for _ in range(5):
         if current is None:
             break
 
-        text = current.get_text(separator=" ", strip=True).lower()
+        text = element_text(current).lower()
 
         if "in-store pickup" in text:
             bad_phrases = [
@@ -697,7 +1205,7 @@ def is_available_in_store(soup: BeautifulSoup) -> bool:
             # No bad phrase in the pickup block -> treat as in-store available
             return True
 
-        current = current.parent  # climb up
+        current = current.getparent()  # climb up
 
     # Fallback if we never find a good container
     return True
@@ -708,7 +1216,11 @@ def is_available_in_store(soup: BeautifulSoup) -> bool:
 
 def extract_sku_from_text(text: str) -> Optional[str]:
     """Look for 'SKU: 101363893' style patterns in the raw HTML."""
-    m = re.search(r"SKU[:\s]+(\d{6,})", text)
+    head = text[:SKU_SEARCH_WINDOW]
+    m = SKU_TEXT_RE.search(head)
+    # A match running up to the window edge may have lost trailing digits.
+    if m is None or m.end() == len(head) < len(text):
+        m = SKU_TEXT_RE.search(text)
     if m:
         return m.group(1)
     return None
@@ -716,30 +1228,30 @@ def extract_sku_from_text(text: str) -> Optional[str]:
 
 def extract_sku_from_url(url: str) -> Optional[str]:
     """Fallback: get SKU from the trailing '-digits.html' in the URL."""
-    m = re.search(r"-(\d{6,})\.html", url)
+    m = SKU_URL_RE.search(url)
     if m:
         return m.group(1)
     return None
 
 
 def parse_basic_info(
-    soup: BeautifulSoup, url: str, store_id: Optional[int] = None
+    doc: lxml_html.HtmlElement, url: str, store_id: Optional[int] = None
 ) -> Tuple[ProductBasic, str]:
     """
     Pull out core attributes and return:
       - ProductBasic dataclass
       - full flattened page text (for spec parsing)
     """
-    full_text = soup.get_text(" ", strip=True)
+    full_text = element_text(doc)
 
     # Name: main H1
-    h1 = soup.find("h1")
-    name = h1.get_text(strip=True) if h1 else None
+    h1 = _FIRST_H1(doc)
+    name = element_text(h1[0], "") if h1 else None
 
     if not name:
-        meta_title = soup.find("meta", property="og:title")
-        if meta_title and meta_title.get("content"):
-            name = meta_title["content"].strip()
+        meta_title = _OG_TITLE(doc)
+        if meta_title and meta_title[0].get("content"):
+            name = meta_title[0].get("content").strip()
 
     if not name:
         # Fallback: use URL slug
@@ -800,98 +1312,130 @@ def extract_spec_values_from_text(full_text: str) -> Dict[str, str]:
     Generic label -> value extractor.
 
     For each label in SPEC_LABELS we:
-      - find its position in the flattened page text
+      - find its first position in the flattened page text
       - grab everything from that label to the start of the next known label
     This handles the dense spec blocks and gives you things like DCOF, etc.
     """
     specs: Dict[str, str] = {}
-    lower = full_text.lower()
 
+    # One scan finds every label occurrence in text order; keep the first
+    # occurrence of each.
     positions: Dict[str, int] = {}
-    for label in SPEC_LABELS:
-        idx = lower.find(label.lower())
-        if idx != -1:
-            positions[label] = idx
-
-    if not positions:
-        return specs
+    for m in SPEC_LABEL_RE.finditer(full_text.lower()):
+        label = _SPEC_LABEL_BY_LOWER[m.group(1)]
+        if label not in positions:
+            positions[label] = m.start()
+            if len(positions) == len(SPEC_LABELS):
+                break
 
-    ordered_labels = sorted(positions.keys(), key=lambda lbl: positions[lbl])
+    ordered_labels = list(positions)
 
     for i, label in enumerate(ordered_labels):
         start = positions[label] + len(label)
         if i + 1 < len(ordered_labels):
-            next_label = ordered_labels[i + 1]
-            end = positions[next_label]
+            end = positions[ordered_labels[i + 1]]
         else:
             end = len(full_text)
 
         value = full_text[start:end].strip(" :\n\t\r")
-        value = re.sub(r"\s{2,}", " ", value)
+        value = _WHITESPACE_RUN_RE.sub(" ", value)
         if value:
             specs[label] = value
 
     return specs
 
 
+def collect_headings(
+    doc: lxml_html.HtmlElement,
+    limit_headings: Tuple[str, ...] = ("h2", "h3", "h4"),
+) -> List[Tuple[str, lxml_html.HtmlElement]]:
+    """
+    (lowercased text, element) for every heading in document order. Collect
+    once per page and hand to find_section_links so several section lookups
+    share a single tree walk.
+    """
+    return [(element_text(el, "").lower(), el) for el in doc.iter(*limit_headings)]
+
+
 def find_section_links(
-    soup: BeautifulSoup,
+    doc: lxml_html.HtmlElement,
     heading_text_substring: str,
     limit_headings: Tuple[str, ...] = ("h2", "h3", "h4"),
+    headings: Optional[List[Tuple[str, lxml_html.HtmlElement]]] = None,
 ) -> List[Tuple[str, str]]:
     """
     Find (label, href) pairs under a section with a heading containing
     heading_text_substring. Used for:
       - "Install & Product documents"
       - "Materials You Need from Start to Finish"
+
+    Pass ``headings`` from collect_headings (same limit_headings) to skip the
+    tree walk.
     """
-    heading = soup.find(
-        lambda tag: isinstance(tag, Tag)
-        and tag.name in limit_headings
-        and heading_text_substring.lower()
-        in tag.get_text(strip=True).lower()
-    )
-    if not heading:
+    if headings is None:
+        headings = collect_headings(doc, limit_headings)
+    needle = heading_text_substring.lower()
+    heading = next((el for text, el in headings if needle in text), None)
+    if heading is None:
         return []
 
     links: List[Tuple[str, str]] = []
-    for sib in heading.next_siblings:
-        if isinstance(sib, Tag) and sib.name in limit_headings:
+    for sib in heading.itersiblings():
+        if not isinstance(sib.tag, str):
+            continue  # comment
+        if sib.tag in limit_headings:
             break
-        if isinstance(sib, Tag):
-            for a in sib.find_all("a", href=True):
-                label = a.get_text(" ", strip=True)
-                href = urljoin(BASE_URL, a["href"])
-                links.append((label, href))
+        for a in sib.iterdescendants("a"):
+            href = a.get("href")
+            if href is None:
+                continue
+            label = element_text(a)
+            links.append((label, urljoin(BASE_URL, href)))
     return links
 
 
 # ---------------------- PRODUCT SCRAPING ----------------------
 
 
-def scrape_product_page_to_sql(
-    conn: sqlite3.Connection,
+def fetch_and_parse_product(
     session: requests.Session,
     product_url: str,
     store_id: int,
     override_sku: Optional[str] = None,
-) -> Optional[str]:
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+    parse_executor: Optional[Executor] = None,
+) -> Union[ScrapedProduct, NotModified, None]:
     """
-    Scrape ONE product page and write:
-      - products
-      - product_specs
-      - product_documents
-      - product_recommended_items
+    Fetch and parse ONE product page. Touches no DB, so it is safe to run in
+    worker threads.
+
+    Given the validators stored from the previous fetch (and override_sku),
+    the GET is conditional; a 304 returns NotModified without parsing.
+
+    With ``parse_executor`` (a process pool), the page is parsed there and
+    this thread just waits, so parsing isn't serialized on the GIL.
 
-    Returns SKU if scraped & stored, or None if skipped (e.g., not in store).
+    Returns None if the page is skipped (fetch error, not in store, no SKU,
+    excluded product type).
     """
     logging.info("Scraping product: %s", product_url)
+    headers = {}
+    if override_sku:
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
     try:
-        r = session.get(product_url, timeout=REQUEST_TIMEOUT)
+        r = session.get(product_url, timeout=REQUEST_TIMEOUT, headers=headers)
     except Exception as e:
         logging.warning("  !! Failed to fetch %s: %s", product_url, e)
         return None
 
+    if r.status_code == 304 and override_sku:
+        logging.info("  -> Not modified since last scrape (SKU=%s)", override_sku)
+        return NotModified(override_sku)
+
     if r.status_code != 200 or "text/html" not in r.headers.get("Content-Type", ""):
         logging.warning(
             "  !! Product %s returned status %s (Content-Type=%s)",
@@ -901,15 +1445,37 @@ def scrape_product_page_to_sql(
         )
         return None
 
-    html = r.text
-    soup = BeautifulSoup(html, "html.parser")
+    args = (r.content, response_encoding(r), product_url, store_id, override_sku)
+    if parse_executor is not None:
+        product = parse_executor.submit(parse_product_page, *args).result()
+    else:
+        product = parse_product_page(*args)
+    if product is not None:
+        product.basic.etag = r.headers.get("ETag")
+        product.basic.last_modified = r.headers.get("Last-Modified")
+    return product
+
+
+def parse_product_page(
+    content: bytes,
+    encoding: str,
+    product_url: str,
+    store_id: int,
+    override_sku: Optional[str] = None,
+) -> Optional[ScrapedProduct]:
+    """
+    Parse a fetched product page. A plain module-level function of bytes
+    and strings, so it can run in a worker process.
+    """
+    # Hand the raw bytes to the parser; lxml decodes them in C.
+    doc = parse_html(content, encoding)
 
     # Availability filter (only keep items actually stocked at this store)
-    if not is_available_in_store(soup):
+    if not is_available_in_store(doc):
         logging.info("  -> Skipping (not in-store stocked for this store)")
         return None
 
-    basic, full_text = parse_basic_info(soup, product_url, store_id=store_id)
+    basic, full_text = parse_basic_info(doc, product_url, store_id=store_id)
 
     # Respect override SKU from caller (e.g., when we already know from URL)
     if override_sku:
@@ -923,7 +1489,7 @@ def scrape_product_page_to_sql(
     combined_for_filter = " ".join(
         part for part in [basic.name, basic.category_slug, basic.url] if part
     ).lower()
-    if any(tok in combined_for_filter for tok in EXCLUDE_PRODUCT_NAME_TOKENS):
+    if EXCLUDE_PRODUCT_NAME_RE.search(combined_for_filter):
         logging.info(
             "  -> Skipping SKU=%s (%s) due to excluded product type",
             basic.sku,
@@ -931,84 +1497,331 @@ def scrape_product_page_to_sql(
         )
         return None
 
-    # Upsert core product info
-    upsert_product(conn, basic)
+    headings = collect_headings(doc)
+    return ScrapedProduct(
+        basic=basic,
+        specs=extract_spec_values_from_text(full_text),  # DCOF, etc.
+        # Install & Product documents (PDFs, care sheets, etc.)
+        docs=find_section_links(
+            doc, "Install & Product documents", headings=headings
+        ),
+        # "Materials You Need from Start to Finish" recommended materials
+        recs=find_section_links(
+            doc, "Materials You Need from Start to Finish", headings=headings
+        ),
+    )
 
-    # Specs (DCOF, etc.)
-    specs = extract_spec_values_from_text(full_text)
-    if specs:
-        save_specs(conn, basic.sku, specs)
-    else:
-        logging.info("  -> No specs parsed for SKU=%s", basic.sku)
 
-    # Install & Product documents (PDFs, care sheets, etc.)
-    docs = find_section_links(soup, "Install & Product documents")
-    if docs:
-        save_docs(conn, basic.sku, docs)
-    else:
-        logging.info("  -> No install/product docs found for SKU=%s", basic.sku)
+def save_scraped_products(
+    conn: sqlite3.Connection, products: Sequence[ScrapedProduct]
+) -> List[str]:
+    """
+    Write a batch of parsed products to:
+      - products
+      - product_specs
+      - product_documents
+      - product_recommended_items
 
-    # "Materials You Need from Start to Finish" recommended materials
-    recs = find_section_links(soup, "Materials You Need from Start to Finish")
-    if recs:
-        save_recommended(conn, basic.sku, recs)
-    else:
-        logging.info(
-            "  -> No 'Materials You Need from Start to Finish' section for SKU=%s",
-            basic.sku,
-        )
+    One executemany per statement and one transaction for the whole batch;
+    `with conn` rolls back on error. A child table is only replaced for a
+    product that has rows for it. If a SKU appears twice, the last one wins.
+    Returns the SKUs written.
+    """
+    latest: Dict[str, ScrapedProduct] = {}
+    for product in products:
+        latest[product.basic.sku] = product
+
+    specs_by_sku: Dict[str, Dict[str, str]] = {}
+    docs_by_sku: Dict[str, List[Tuple[str, str]]] = {}
+    recs_by_sku: Dict[str, List[Tuple[str, str]]] = {}
+    for sku, product in latest.items():
+        if product.specs:
+            logging.info("  -> SKU=%s specs: %d entries", sku, len(product.specs))
+            specs_by_sku[sku] = product.specs
+        else:
+            logging.info("  -> No specs parsed for SKU=%s", sku)
 
-    logging.info("  -> Done SKU=%s", basic.sku)
-    return basic.sku
+        if product.docs:
+            logging.info("  -> SKU=%s docs: %d links", sku, len(product.docs))
+            docs_by_sku[sku] = product.docs
+        else:
+            logging.info("  -> No install/product docs found for SKU=%s", sku)
 
+        if product.recs:
+            logging.info("  -> SKU=%s recommended: %d items", sku, len(product.recs))
+            recs_by_sku[sku] = product.recs
+        else:
+            logging.info(
+                "  -> No 'Materials You Need from Start to Finish' section for SKU=%s",
+                sku,
+            )
 
-def scrape_product_if_stale(
-    conn: sqlite3.Connection,
-    session: requests.Session,
-    product_url: str,
-    store_id: int,
+    with conn:
+        upsert_products(conn, [product.basic for product in latest.values()])
+        save_specs(conn, specs_by_sku)
+        save_docs(conn, docs_by_sku)
+        save_recommended(conn, recs_by_sku)
+
+    logging.info("  -> Wrote %d products", len(latest))
+    return list(latest)
+
+
+def save_scraped_product(conn: sqlite3.Connection, product: ScrapedProduct) -> str:
+    """Write one parsed product (see save_scraped_products). Returns the SKU."""
+    save_scraped_products(conn, [product])
+    return product.basic.sku
+
+
+def is_fresh(
+    sku: Optional[str],
     ttl: timedelta,
-) -> Optional[str]:
+    scrape_state: Dict[str, ScrapeState],
+    now: datetime,
+    max_ttl: Optional[timedelta] = None,
+) -> bool:
     """
-    Check last_scraped_at for this SKU. If it's missing or older than TTL,
-    scrape + save. If it's fresh, skip and return None.
+    True if this SKU was scraped within its TTL and can be skipped.
+
+    ``scrape_state`` comes from load_scrape_state; a SKU's own adaptive TTL
+    replaces ``ttl``, capped at ``max_ttl``. ``now`` is one clock reading
+    for the whole run.
     """
-    sku_guess = extract_sku_from_url(product_url)
-    if sku_guess:
-        existing_ts = get_existing_last_scraped(conn, sku_guess)
-        if existing_ts is not None:
-            age = datetime.utcnow() - existing_ts
-            if age <= ttl:
-                logging.info(
-                    "Skipping SKU=%s (age=%.2f days <= ttl=%.2f days)",
-                    sku_guess,
-                    age.total_seconds() / 86400,
-                    ttl.total_seconds() / 86400,
-                )
-                return None
+    if not sku:
+        return False
+    state = scrape_state.get(sku)
+    if state is None or state.last_scraped_at is None:
+        return False
+    if state.ttl is not None:
+        ttl = state.ttl
+    if max_ttl is not None:
+        ttl = min(ttl, max_ttl)
+    age = now - state.last_scraped_at
+    if age > ttl:
+        return False
+    logging.info(
+        "Skipping SKU=%s (age=%.2f days <= ttl=%.2f days)",
+        sku,
+        age.total_seconds() / 86400,
+        ttl.total_seconds() / 86400,
+    )
+    return True
 
-    return scrape_product_page_to_sql(
-        conn,
-        session=session,
-        product_url=product_url,
-        store_id=store_id,
-        override_sku=sku_guess,
+
+def content_hash(product: ScrapedProduct) -> str:
+    """
+    Digest of everything we store for a product, minus bookkeeping. The
+    store isn't part of it, so stores that see the same page agree.
+    """
+    basic = product.basic
+    payload = (
+        basic.name,
+        basic.url,
+        basic.category_slug,
+        basic.price_per_sqft,
+        basic.price_per_box,
+        basic.size_primary,
+        basic.color,
+        basic.finish,
+        sorted(product.specs.items()),
+        product.docs,
+        product.recs,
     )
+    return hashlib.blake2b(repr(payload).encode(), digest_size=16).hexdigest()
+
+
+def next_ttl(
+    previous: Optional[timedelta], changed: bool, initial: timedelta
+) -> timedelta:
+    """
+    Adaptive re-scrape interval: start at ``initial``, double while the page
+    stays the same (up to MAX_TTL), halve when it changes (down to MIN_TTL).
+    """
+    if previous is None:
+        return initial
+    if changed:
+        return min(max(previous / 2, MIN_TTL), MAX_TTL)
+    return min(max(previous * 2, MIN_TTL), MAX_TTL)
+
+
+def plan_next_scrape(
+    product: ScrapedProduct, state: Optional[ScrapeState], initial: timedelta
+) -> None:
+    """Stamp the product's content hash and next TTL before it is written."""
+    basic = product.basic
+    basic.content_hash = content_hash(product)
+    if state is None or state.content_hash is None:
+        # New SKU, or a row from before hashes were stored: nothing to compare.
+        ttl = next_ttl(None, True, initial)
+    else:
+        ttl = next_ttl(
+            state.ttl if state.ttl is not None else initial,
+            changed=state.content_hash != basic.content_hash,
+            initial=initial,
+        )
+    basic.ttl_seconds = ttl.total_seconds()
 
 
 # ---------------------- MAIN PIPELINE ----------------------
 
 
+def flush_products(conn: sqlite3.Connection, products: List[ScrapedProduct]) -> int:
+    """
+    Save a batch in one transaction. If the batch fails (e.g. a URL clash),
+    retry product by product so one bad row only loses itself. Returns the
+    number of products saved.
+    """
+    if not products:
+        return 0
+    try:
+        return len(save_scraped_products(conn, products))
+    except sqlite3.Error as e:
+        logging.warning(
+            "Batch write of %d products failed (%s); retrying one by one",
+            len(products),
+            e,
+        )
+
+    saved = 0
+    for product in products:
+        try:
+            save_scraped_product(conn, product)
+            saved += 1
+        except sqlite3.Error as e:
+            logging.exception("Error saving SKU=%s: %s", product.basic.sku, e)
+    return saved
+
+
+def checkpoint_path(db_path: Path, store_id: int) -> Path:
+    """Resume checkpoint for one store's run, kept next to the DB."""
+    return db_path.with_name(f"{db_path.name}.{store_id}.ckpt")
+
+
+def url_list_digest(urls: Sequence[str]) -> str:
+    """Fingerprint of the sorted URL list a checkpoint offset refers to."""
+    h = hashlib.blake2b(digest_size=16)
+    for url in urls:
+        h.update(url.encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def read_checkpoint(path: Path, digest: str) -> int:
+    """
+    Offset to resume from: the saved one if the checkpoint was written for
+    the same URL list, else 0.
+    """
+    try:
+        saved_digest, offset = path.read_text(encoding="utf-8").split()
+        if saved_digest == digest:
+            return int(offset)
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def write_checkpoint(path: Path, digest: str, offset: int) -> None:
+    # Write then rename, so a crash mid-write leaves the old checkpoint.
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(f"{digest} {offset}\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def write_results(
+    db_path: Path,
+    results: "queue.Queue[Optional[WriteItem]]",
+    batch_size: int,
+    ckpt_path: Path,
+    ckpt_digest: str,
+    stats: WriterStats,
+) -> None:
+    """
+    Writer thread for scrape_store. Owns its own connection and drains
+    ``results`` until a None sentinel, committing ``batch_size`` rows at a
+    time (or whatever has arrived after WRITE_FLUSH_SECONDS), so the scrape
+    loop only waits on disk when the queue is full.
+
+    If opening the DB or writing fails, the error goes in ``stats`` and the
+    queue is still drained, so the scrape loop never blocks on it.
+    """
+    conn: Optional[sqlite3.Connection] = None
+    pending: List[ScrapedProduct] = []
+    unchanged: List[ScrapeStateRow] = []
+    last_flush = time.monotonic()
+
+    def flush() -> None:
+        nonlocal pending, unchanged, last_flush
+        stats.scraped += flush_products(conn, pending)
+        stats.unchanged += mark_unchanged(conn, unchanged)
+        pending, unchanged = [], []
+        last_flush = time.monotonic()
+
+    stopped = False
+    try:
+        conn = init_db(db_path)
+        while True:
+            try:
+                item = results.get(timeout=WRITE_FLUSH_SECONDS)
+            except queue.Empty:
+                flush()
+                continue
+            if item is None:
+                stopped = True
+                break
+            if isinstance(item, CheckpointMark):
+                flush()
+                write_checkpoint(ckpt_path, ckpt_digest, item.offset)
+                continue
+            if isinstance(item, ScrapeStateRow):
+                unchanged.append(item)
+            else:
+                pending.append(item)
+            if (
+                len(pending) + len(unchanged) >= batch_size
+                or time.monotonic() - last_flush >= WRITE_FLUSH_SECONDS
+            ):
+                flush()
+        flush()
+    except Exception as e:
+        logging.exception("Writer for %s failed: %s", db_path, e)
+        stats.error = e
+        while not stopped:
+            stopped = results.get() is None
+    finally:
+        if conn is not None:
+            conn.close()
+
+
 def scrape_store(
     store_id: int,
     db_path: Path,
     ttl_days: float,
+    workers: int = DEFAULT_WORKERS,
+    batch_size: int = WRITE_BATCH_SIZE,
+    max_ttl_days: float = DEFAULT_MAX_TTL_DAYS,
+    parse_processes: int = 0,
 ) -> None:
     """
     Entry point to scrape all relevant products for a given store.
+
+    Each SKU carries its own re-scrape interval: ``ttl_days`` for a new SKU,
+    then doubled each time a re-scrape finds the page unchanged and halved
+    when it changed. This run treats any interval over ``max_ttl_days`` as
+    ``max_ttl_days``; 0 re-fetches every product without conditional
+    headers and rewrites it even if its content hash matches.
+
+    Parsed products are committed ``batch_size`` at a time, so a run costs
+    one transaction (and one WAL sync) per batch rather than per product.
+    The writes run on a writer thread (see write_results) fed through a
+    bounded queue, so fetching carries on while a batch commits.
+    After each batch the position in the sorted URL list is saved to a
+    checkpoint file; a rerun that discovers the same URLs starts from there,
+    and a run that finishes removes the file.
+
+    With ``parse_processes`` > 0, product pages are parsed in a pool of that
+    many processes; the threads then only wait on the network.
     """
     conn = init_db(db_path)
-    session = make_session()
+    session = make_session(pool_maxsize=max(64, workers))
 
     set_store_context(session, store_id)
 
@@ -1016,37 +1829,208 @@ def scrape_store(
     category_slugs = discover_category_slugs(session)
     logging.info("Using %d category slugs", len(category_slugs))
 
-    # Crawl each category for product URLs
+    # Crawl each category for product URLs. Categories are independent, so
+    # their crawls run side by side on the shared session.
     all_product_urls: Set[str] = set()
-    for slug in category_slugs:
-        urls_for_cat = fetch_product_urls_for_category(session, slug)
-        all_product_urls |= urls_for_cat
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for urls_for_cat in executor.map(
+            lambda slug: fetch_product_urls_for_category(session, slug),
+            category_slugs,
+        ):
+            all_product_urls |= urls_for_cat
 
     logging.info("Total unique product URLs discovered: %d", len(all_product_urls))
 
     ttl = timedelta(days=ttl_days)
-    scraped_count = 0
+    max_ttl = timedelta(days=max_ttl_days)
+    force = max_ttl_days <= 0
     processed_count = 0
 
-    for product_url in sorted(all_product_urls):
-        processed_count += 1
-        try:
-            res = scrape_product_if_stale(
-                conn,
-                session=session,
-                product_url=product_url,
-                store_id=store_id,
-                ttl=ttl,
-            )
-            if res is not None:
-                scraped_count += 1
-        except Exception as e:
-            logging.exception("Error scraping %s: %s", product_url, e)
+    sku_guesses = {url: extract_sku_from_url(url) for url in all_product_urls}
+    scrape_state = load_scrape_state(
+        conn, store_id, {sku for sku in sku_guesses.values() if sku}
+    )
+    started_at = datetime.now(timezone.utc)
+
+    sorted_urls = sorted(all_product_urls)
+    ckpt_path = checkpoint_path(db_path, store_id)
+    ckpt_digest = url_list_digest(sorted_urls)
+    start = read_checkpoint(ckpt_path, ckpt_digest)
+    if start:
+        logging.info(
+            "Resuming store_id=%s at URL %d/%d from %s",
+            store_id,
+            start,
+            len(sorted_urls),
+            ckpt_path,
+        )
+
+    # TTL checks run here on the main thread; fetch + parse goes to the
+    # pool and writes to the writer thread. At most max_in_flight pages are
+    # queued or unconsumed, and WRITE_QUEUE_SIZE results unwritten, at a
+    # time, so memory stays flat however many URLs were discovered.
+    results: "queue.Queue[Optional[WriteItem]]" = queue.Queue(WRITE_QUEUE_SIZE)
+    stats = WriterStats()
+    writer = threading.Thread(
+        target=write_results,
+        args=(db_path, results, batch_size, ckpt_path, ckpt_digest, stats),
+        name=f"writer-{store_id}",
+        daemon=True,
+    )
+    writer.start()
+
+    urls = enumerate(sorted_urls[start:], start)
+    next_index = start
+    max_in_flight = 2 * workers
+    in_flight: Dict[Future, Tuple[int, str]] = {}
+    error_counts: Counter[str] = Counter()
+    queued_since_mark = 0
+    # Spawned, not forked: the pool starts its workers on the first submit,
+    # when this process is already running fetch and writer threads, and
+    # forking a threaded process can deadlock the child.
+    parse_pool: ContextManager[Optional[Executor]] = nullcontext()
+    if parse_processes > 0:
+        parse_pool = ProcessPoolExecutor(
+            max_workers=parse_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_logging,
+        )
+    with parse_pool as parse_executor, ThreadPoolExecutor(
+        max_workers=workers
+    ) as executor:
+        while True:
+            if stats.error is not None:
+                # The writer has stopped, so anything fetched from here on
+                # would be dropped: stop fetching and raise its error below.
+                for future in in_flight:
+                    future.cancel()
+                break
+            for index, product_url in urls:
+                if stats.error is not None:
+                    break
+                next_index = index + 1
+                processed_count += 1
+                sku_guess = sku_guesses[product_url]
+                if is_fresh(
+                    sku_guess, ttl, scrape_state, now=started_at, max_ttl=max_ttl
+                ):
+                    continue
+                state = scrape_state.get(sku_guess) if sku_guess and not force else None
+                future = executor.submit(
+                    fetch_and_parse_product,
+                    session,
+                    product_url,
+                    store_id,
+                    override_sku=sku_guess,
+                    etag=state.etag if state else None,
+                    last_modified=state.last_modified if state else None,
+                    parse_executor=parse_executor,
+                )
+                in_flight[future] = (index, product_url)
+                if len(in_flight) >= max_in_flight:
+                    break
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                _, product_url = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Log the 1st, 2nd, 4th, 8th... error of each type with
+                    # a traceback; an upstream failure storm would otherwise
+                    # spend its time formatting identical tracebacks.
+                    kind = type(e).__name__
+                    error_counts[kind] += 1
+                    n = error_counts[kind]
+                    if n & (n - 1) == 0:
+                        logging.exception(
+                            "Error scraping %s (%s #%d): %s", product_url, kind, n, e
+                        )
+                    continue
+                if isinstance(result, NotModified):
+                    # Unchanged by definition, so its TTL grows as for a
+                    # same-hash re-scrape, and the validators sent stay valid.
+                    state = scrape_state.get(result.sku)
+                    next_seconds = None
+                    if state is not None and state.content_hash is not None:
+                        next_seconds = next_ttl(
+                            state.ttl if state.ttl is not None else ttl, False, ttl
+                        ).total_seconds()
+                    results.put(
+                        ScrapeStateRow(
+                            result.sku,
+                            store_id,
+                            next_seconds,
+                            etag=state.etag if state else None,
+                            last_modified=state.last_modified if state else None,
+                        )
+                    )
+                elif result is not None:
+                    basic = result.basic
+                    state = scrape_state.get(basic.sku)
+                    plan_next_scrape(result, state, ttl)
+                    if (
+                        not force
+                        and state is not None
+                        and state.row_hash == basic.content_hash
+                    ):
+                        # Same content as the products row: no need to
+                        # rewrite it. (The TTL above compared against this
+                        # store's last scrape, which is what it tracks.)
+                        results.put(
+                            ScrapeStateRow(
+                                basic.sku,
+                                store_id,
+                                basic.ttl_seconds,
+                                basic.content_hash,
+                                basic.etag,
+                                basic.last_modified,
+                            )
+                        )
+                    else:
+                        results.put(result)
+                else:
+                    continue
+                queued_since_mark += 1
+                if queued_since_mark >= batch_size:
+                    # Everything before the oldest page still in flight
+                    # has now been queued (or skipped).
+                    results.put(
+                        CheckpointMark(
+                            min((i for i, _ in in_flight.values()), default=next_index)
+                        )
+                    )
+                    queued_since_mark = 0
+
+    results.put(None)
+    writer.join()
+    if stats.error is not None:
+        raise stats.error
+    ckpt_path.unlink(missing_ok=True)
+
+    ensure_url_index(conn)
+    if error_counts:
+        logging.warning(
+            "Scrape errors by type: %s",
+            ", ".join(f"{kind}={n}" for kind, n in error_counts.most_common()),
+        )
+    # Refresh planner statistics where this run changed the tables enough to
+    # matter (a cheap, conditional ANALYZE).
+    conn.execute("PRAGMA optimize")
+    # Fold the run's WAL back into the DB and truncate it, so a big scrape
+    # doesn't leave a large -wal file behind. If the API is mid-read this
+    # just gives up (busy) and the next checkpoint catches up.
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
     logging.info(
-        "Done. Processed=%d URLs, scraped/updated=%d rows into %s",
+        "Done store_id=%s. Processed=%d URLs, scraped/updated=%d rows, "
+        "unchanged=%d, into %s",
+        store_id,
         processed_count,
-        scraped_count,
+        stats.scraped,
+        stats.unchanged,
         db_path,
     )
     conn.close()
@@ -1055,15 +2039,30 @@ def scrape_store(
 # ---------------------- CLI ----------------------
 
 
+def parse_store_ids(value: str) -> List[int]:
+    """argparse type for --store-id: one storeID or a comma-separated list."""
+    try:
+        store_ids = [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid store id list: {value!r}")
+    if not store_ids:
+        raise argparse.ArgumentTypeError("at least one store id is required")
+    return list(dict.fromkeys(store_ids))
+
+
 def parse_args(argv: List[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Scrape Floor & Decor product data for a store into SQLite."
     )
     parser.add_argument(
         "--store-id",
-        type=int,
+        type=parse_store_ids,
         required=True,
-        help="Floor & Decor storeID (e.g., 238 for San Leandro).",
+        help=(
+            "Floor & Decor storeID (e.g., 238 for San Leandro), or a "
+            "comma-separated list (238,239) to scrape several stores "
+            "concurrently into the same DB."
+        ),
     )
     parser.add_argument(
         "--db",
@@ -1076,9 +2075,49 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         type=float,
         default=1.0,
         help=(
-            "Time-to-live in days for existing products. "
-            "If last_scraped_at is newer than this, skip re-scrape. "
-            "Default: 1.0"
+            "Time-to-live in days for newly seen products. "
+            "If last_scraped_at is newer than a product's TTL, skip re-scrape; "
+            "the TTL then doubles while the page is unchanged and halves when "
+            "it changes. Default: 1.0"
+        ),
+    )
+    parser.add_argument(
+        "--max-ttl-days",
+        type=float,
+        default=DEFAULT_MAX_TTL_DAYS,
+        help=(
+            "Upper bound on the TTL this run honours (stored TTLs are kept); "
+            "0 re-fetches and rewrites every product. "
+            f"Default: {DEFAULT_MAX_TTL_DAYS}"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=(
+            "Number of categories to crawl, then product pages to fetch and "
+            "parse, concurrently. "
+            f"Default: {DEFAULT_WORKERS}"
+        ),
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=WRITE_BATCH_SIZE,
+        help=(
+            "Number of scraped products written per transaction. "
+            f"Default: {WRITE_BATCH_SIZE}"
+        ),
+    )
+    parser.add_argument(
+        "--parse-processes",
+        type=int,
+        default=0,
+        help=(
+            "Parse product pages in this many worker processes instead of "
+            "the fetch threads (use when parsing, not the network, is the "
+            "bottleneck). Default: 0 (parse in the fetch threads)"
         ),
     )
     return parser.parse_args(argv)
@@ -1088,12 +2127,37 @@ def main(argv: List[str]) -> None:
     init_logging()
     args = parse_args(argv)
 
-    store_id = args.store_id
+    store_ids = args.store_id
     db_path = Path(args.db)
     ttl_days = args.ttl_days
+    workers = args.workers
+    batch_size = args.batch_size
+    max_ttl_days = args.max_ttl_days
+    parse_processes = args.parse_processes
+
+    def run(store_id: int) -> None:
+        logging.info("Starting scrape for store_id=%s -> DB=%s", store_id, db_path)
+        scrape_store(
+            store_id=store_id,
+            db_path=db_path,
+            ttl_days=ttl_days,
+            workers=workers,
+            batch_size=batch_size,
+            max_ttl_days=max_ttl_days,
+            parse_processes=parse_processes,
+        )
 
-    logging.info("Starting scrape for store_id=%s -> DB=%s", store_id, db_path)
-    scrape_store(store_id=store_id, db_path=db_path, ttl_days=ttl_days)
+    if len(store_ids) == 1:
+        run(store_ids[0])
+        return
+
+    # Each store gets its own session (the store context is a cookie) and
+    # its own connection; WAL lets their batch writes interleave. Create /
+    # migrate the schema once up front so the stores don't race on it.
+    init_db(db_path).close()
+    with ThreadPoolExecutor(max_workers=len(store_ids)) as executor:
+        for future in [executor.submit(run, store_id) for store_id in store_ids]:
+            future.result()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,97 @@
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import scrape_products  # noqa: E402
+
+PRODUCT_COUNT = 600
+
+PRODUCT_PAGE = """<html><body><h1>Alto {sku} Porcelain Tile</h1>
+<p>SKU: {sku} Size: 12x24 $3.49 / sqft</p>
+<div>In-Store Pickup Available today</div></body></html>"""
+
+
+class FakeResponse:
+    def __init__(self, text: str) -> None:
+        self.content = text.encode("utf-8")
+        self.text = text
+        self.status_code = 200
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+        self.url = ""
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class FakeSession:
+    """One category whose listing page links PRODUCT_COUNT product pages."""
+
+    headers: dict = {}
+
+    def __init__(self) -> None:
+        self.product_fetches = 0
+        self._lock = threading.Lock()
+
+    def mount(self, *args, **kwargs) -> None:
+        pass
+
+    def get(self, url: str, **kwargs) -> FakeResponse:
+        if url.endswith(".html"):
+            with self._lock:
+                self.product_fetches += 1
+            # Slow enough that the writer fails while most URLs are unfetched.
+            time.sleep(0.005)
+            sku = scrape_products.extract_sku_from_url(url)
+            return FakeResponse(PRODUCT_PAGE.format(sku=sku))
+        if "/sitemap" in url:
+            return FakeResponse('<a href="/tile">Tile</a>')
+        links = "".join(
+            f'<a href="/tile/alto-tile-{1000000 + i}.html">p</a>'
+            for i in range(PRODUCT_COUNT)
+        )
+        return FakeResponse(links)
+
+
+class WriterFailureTest(unittest.TestCase):
+    def test_writer_failure_stops_fetching(self) -> None:
+        session = FakeSession()
+        workers = 2
+
+        def failing_flush(conn, products):
+            if products:
+                raise sqlite3.OperationalError("disk I/O error")
+            return 0
+
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.multiple(
+            scrape_products,
+            make_session=lambda *args, **kwargs: session,
+            flush_products=failing_flush,
+            SLEEP_BETWEEN_REQUESTS=0,
+        ):
+            with self.assertRaises(sqlite3.OperationalError):
+                scrape_products.scrape_store(
+                    238,
+                    Path(tmp) / "products.db",
+                    ttl_days=1.0,
+                    workers=workers,
+                    batch_size=10,
+                )
+
+        # Only the batch that failed plus what was already in flight, not
+        # the whole catalogue.
+        self.assertGreater(session.product_fetches, 0)
+        self.assertLess(session.product_fetches, 10 + 2 * workers + 50)
+
+
+if __name__ == "__main__":
+    unittest.main()